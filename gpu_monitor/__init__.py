@@ -1,4 +1,5 @@
 import argparse
+import math
 import os
 import signal
 import subprocess
@@ -6,16 +7,34 @@ import sys
 import threading
 import time
 from pathlib import Path
-from datetime import datetime
 
 from .logger import GPULogger
 from .visualizer import GPUMonitorApp
-from .utils import find_logs, get_latest_log
+from .utils import get_latest_log
+from .ringlog import DEFAULT_RING_SLOTS
+
+try:
+    import psutil
+    HAS_PSUTIL = True
+except ImportError:
+    HAS_PSUTIL = False
 
 PID_FILE = Path(__file__).parent.parent / 'logs' / '.logger.pid'
 
 
-def main():
+def _positive_seconds(text):
+    """argparse type for --interval: a finite number of seconds above 0."""
+    try:
+        value = float(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid number: {text!r}")
+    if not (value > 0 and math.isfinite(value)):
+        raise argparse.ArgumentTypeError(f"must be greater than 0, got {text}")
+    return value
+
+
+def _build_parser():
+    """Build the command-line parser."""
     parser = argparse.ArgumentParser(
         description='GPU Monitor - Log and visualize NVIDIA GPU metrics'
     )
@@ -25,7 +44,7 @@ def main():
     log_parser = subparsers.add_parser('log', help='Start logging GPU metrics')
     log_parser.add_argument(
         '--interval',
-        type=float,
+        type=_positive_seconds,
         default=1.0,
         help='Sampling interval in seconds (default: 1.0)'
     )
@@ -34,6 +53,19 @@ def main():
         type=str,
         help='Output log file path (default: auto-generated in logs/)'
     )
+    log_parser.add_argument(
+        '--format',
+        choices=['csv', 'ring'],
+        default='csv',
+        help='Log format: growing CSV file, or fixed-size binary ring buffer '
+             'without the DCGM-only columns (default: csv)'
+    )
+    log_parser.add_argument(
+        '--ring-slots',
+        type=int,
+        default=DEFAULT_RING_SLOTS,
+        help=f'Samples kept by a ring log before overwriting the oldest (default: {DEFAULT_RING_SLOTS})'
+    )
 
     # View command
     view_parser = subparsers.add_parser('view', help='Visualize GPU log file')
@@ -74,12 +106,16 @@ def main():
     )
 
     # List command
-    list_parser = subparsers.add_parser('list', help='List available log files')
+    subparsers.add_parser('list', help='List available log files')
 
     # Stop command
-    stop_parser = subparsers.add_parser('stop', help='Stop background logging')
+    subparsers.add_parser('stop', help='Stop background logging')
+
+    return parser
 
-    args = parser.parse_args()
+
+def main():
+    args = _build_parser().parse_args()
 
     # Default behavior: run both logging and visualization
     if args.command is None:
@@ -100,20 +136,10 @@ def run_combined_mode():
     script_path = Path(__file__).parent.parent / 'gpu-monitor'
 
     # Check if logging is already running via PID file
-    logger_active = False
-    pid = None
-    if PID_FILE.exists():
-        try:
-            pid = int(PID_FILE.read_text().strip())
-            os.kill(pid, 0)  # Check if process exists
-            logger_active = True
-        except (ProcessLookupError, ValueError):
-            PID_FILE.unlink(missing_ok=True)
-        except PermissionError:
-            logger_active = True
+    pid = _read_logger_pid()
 
     latest = get_latest_log()
-    if logger_active and latest:
+    if pid is not None and latest:
         print(f"Logging already active (PID {pid}): {latest.name}")
         log_file = latest
     else:
@@ -125,16 +151,76 @@ def run_combined_mode():
     app.run()
 
 
-def _start_background_logger(script_path):
-    """Start gpu-monitor log as a detached background process."""
+def _is_logger_process(pid):
+    """Check that pid is alive and is a `gpu-monitor log` process.
+
+    A bare existence check is not enough: after a crash or reboot the PID in
+    PID_FILE can be recycled by an unrelated process.
+    """
+    try:
+        with open(f'/proc/{pid}/cmdline', 'rb') as f:
+            cmdline = f.read().decode(errors='replace').split('\0')
+    except FileNotFoundError:
+        if Path('/proc/self').exists():
+            return False
+        # No procfs (non-Linux): fall back to psutil, then to a signal probe
+        if HAS_PSUTIL:
+            try:
+                cmdline = psutil.Process(pid).cmdline()
+            except psutil.NoSuchProcess:
+                return False
+            except psutil.AccessDenied:
+                return True
+        else:
+            try:
+                os.kill(pid, 0)
+            except ProcessLookupError:
+                return False
+            except PermissionError:
+                pass
+            return True
+    except PermissionError:
+        return True
+
+    return (any(Path(arg).name == 'gpu-monitor' for arg in cmdline)
+            and 'log' in cmdline)
+
+
+def _read_logger_pid():
+    """Return the PID of the running background logger, or None.
+
+    Removes PID_FILE if it is stale.
+    """
+    if not PID_FILE.exists():
+        return None
+    try:
+        pid = int(PID_FILE.read_text().strip())
+    except (OSError, ValueError):
+        pid = None
+    if pid is not None and _is_logger_process(pid):
+        return pid
+    PID_FILE.unlink(missing_ok=True)
+    return None
+
+
+def _default_log_path(suffix):
+    """Return a new timestamped log path in logs/, creating the directory."""
     logs_dir = Path(__file__).parent.parent / 'logs'
     logs_dir.mkdir(exist_ok=True)
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    log_file = logs_dir / f'gpu_{timestamp}.csv'
+    timestamp = time.strftime('%Y%m%d_%H%M%S')
+    return logs_dir / f'gpu_{timestamp}.{suffix}'
+
+
+def _start_background_logger(script_path):
+    """Start gpu-monitor log as a detached background process."""
+    # Ring log: the viewer reads new samples straight out of the shared
+    # page-cache mapping instead of re-parsing a growing CSV
+    log_file = _default_log_path('ring')
 
     # Start as detached subprocess that survives parent exit
     proc = subprocess.Popen(
-        [sys.executable, str(script_path), 'log', '--output', str(log_file)],
+        [sys.executable, str(script_path), 'log', '--format', 'ring',
+         '--output', str(log_file)],
         start_new_session=True,
         stdout=subprocess.DEVNULL,
         stderr=subprocess.DEVNULL,
@@ -156,12 +242,10 @@ def run_log_mode(args):
     if args.output:
         log_file = Path(args.output)
     else:
-        logs_dir = Path(__file__).parent.parent / 'logs'
-        logs_dir.mkdir(exist_ok=True)
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        log_file = logs_dir / f'gpu_{timestamp}.csv'
+        log_file = _default_log_path(args.format)
 
-    logger = GPULogger(log_file, interval=args.interval)
+    logger = GPULogger(log_file, interval=args.interval,
+                       log_format=args.format, ring_slots=args.ring_slots)
     stop_event = threading.Event()
 
     # Write PID so stop command can find us
@@ -188,6 +272,10 @@ def run_log_mode(args):
         logger.start_logging(stop_event)
     except KeyboardInterrupt:
         print("\nStopping logging...")
+    except ValueError as e:
+        # e.g. an existing log in another format or with other columns
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
     finally:
         _cleanup()
 
@@ -227,7 +315,10 @@ def run_stop_mode():
         print("No background logger running (no PID file found)")
         return
 
-    pid = int(PID_FILE.read_text().strip())
+    pid = _read_logger_pid()
+    if pid is None:
+        print("Logger process already exited (removed stale PID file)")
+        return
 
     try:
         os.kill(pid, signal.SIGTERM)
@@ -243,17 +334,31 @@ def run_stop_mode():
 
 def run_list_mode():
     """List available log files."""
-    logs = find_logs()
+    logs_dir = Path(__file__).parent.parent / 'logs'
+
+    # One stat per file: DirEntry caches it, and size/mtime come from the
+    # same result
+    logs = []
+    try:
+        with os.scandir(logs_dir) as it:
+            for entry in it:
+                if (entry.name.startswith('gpu_')
+                        and entry.name.endswith(('.csv', '.ring'))
+                        and entry.is_file()):
+                    logs.append((entry.name, entry.stat()))
+    except FileNotFoundError:
+        pass
 
     if not logs:
         print("No log files found in logs/ directory")
         return
 
+    logs.sort(key=lambda item: item[1].st_mtime)
+
     print(f"Found {len(logs)} log file(s):\n")
-    for log_file in logs:
-        size = log_file.stat().st_size
-        mtime = datetime.fromtimestamp(log_file.stat().st_mtime)
-        print(f"  {log_file.name}")
-        print(f"    Size: {size:,} bytes")
-        print(f"    Modified: {mtime.strftime('%Y-%m-%d %H:%M:%S')}")
+    for name, st in logs:
+        mtime = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(st.st_mtime))
+        print(f"  {name}")
+        print(f"    Size: {st.st_size:,} bytes")
+        print(f"    Modified: {mtime}")
         print()
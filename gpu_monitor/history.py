@@ -0,0 +1,176 @@
+"""Columnar in-memory store of parsed log samples for the viewer.
+
+The parsers yield one dict per sample; the viewer keeps them as one NumPy
+array per field instead, so slicing a time window or pulling a metric for a
+plot is an array operation rather than a loop over dicts.
+"""
+
+import numpy as np
+
+# Compact storage types per metric: utilization (%) and temperature (C)
+# fit in a byte, memory is whole MiB (uint16 would overflow past 64 GiB).
+# Power stays float64: in float32 a two-decimal reading like 204.85 can
+# round the other way in the one-decimal labels
+METRIC_DTYPES = {
+    'utilization_gpu': np.uint8,
+    'temperature': np.uint8,
+    'memory_used': np.uint32,
+    'memory_total': np.uint32,
+    'power_draw': np.float64,
+}
+
+# One array per sample field. Timestamps are naive local times, like the
+# '_ts' datetimes the parsers produce
+COLUMN_DTYPES = {
+    '_ts': 'datetime64[us]',
+    'gpu_id': np.int16,
+    **METRIC_DTYPES,
+    'process_info': object,
+}
+
+
+class SampleHistory:
+    """Time-ordered log samples stored as a structure of arrays.
+
+    Columns grow geometrically; column() and take() hand out views or copies
+    of the filled part, which later appends never overwrite. The row indices
+    of each GPU are grouped as rows arrive, so per-GPU lookups need no scan.
+
+    With a capacity, only the newest `capacity` samples are kept: storage
+    stops growing at twice the capacity, and the kept samples are moved back
+    to its front once it fills up, so appends stay amortized O(1).
+    """
+
+    def __init__(self, rows=(), capacity=None):
+        self.capacity = capacity
+        self._start = 0  # Storage offset of the oldest kept sample
+        self._size = 0
+        self._appended = 0  # Samples ever appended; numbers the rows in _gpu_rows
+        self._columns = {name: np.empty(0, dtype=dtype)
+                         for name, dtype in COLUMN_DTYPES.items()}
+        self._gpu_rows = {}  # gpu_id -> sample number arrays, joined on first read
+        self.extend(rows)
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def appended(self):
+        """Samples ever appended, including any dropped since."""
+        return self._appended
+
+    def extend(self, rows):
+        """Append rows in the dict format of parse_log_file / read_ring_log."""
+        if rows:
+            self.extend_columns({name: [row[name] for row in rows] for name in self._columns})
+
+    def extend_columns(self, columns):
+        """Append samples given as {field: sequence}, e.g. from parse_log_columns."""
+        n = len(columns['_ts'])
+        if not n:
+            return
+        if self.capacity is not None and n > self.capacity:
+            self._appended += n - self.capacity
+            columns = {name: values[-self.capacity:] for name, values in columns.items()}
+            n = self.capacity
+        at = self._start + self._size
+        if at + n > len(self._columns['_ts']):
+            self._make_room(n)
+            at = self._size
+        for name, column in self._columns.items():
+            values = columns[name]
+            if column.dtype.kind in 'iu':
+                values = np.rint(values)
+            column[at:at + n] = values
+
+        gpu_col = self._columns['gpu_id'][at:at + n]
+        for gpu_id in np.unique(gpu_col).tolist():
+            self._gpu_rows.setdefault(gpu_id, []).append(
+                np.flatnonzero(gpu_col == gpu_id) + self._appended)
+        self._appended += n
+        self._size += n
+
+        if self.capacity is not None and self._size > self.capacity:
+            self._start += self._size - self.capacity
+            self._size = self.capacity
+
+    def _make_room(self, n):
+        """Move the kept samples to the front of storage, growing it if needed."""
+        capacity = len(self._columns['_ts'])
+        if self._size + n > capacity:
+            capacity = max(self._size + n, 2 * capacity, 1024)
+            if self.capacity is not None:
+                capacity = min(capacity, 2 * self.capacity)
+        kept = slice(self._start, self._start + self._size)
+        for name, column in self._columns.items():
+            if capacity != len(column):
+                grown = np.empty(capacity, dtype=column.dtype)
+                grown[:self._size] = column[kept]
+                self._columns[name] = grown
+            else:
+                column[:self._size] = column[kept]
+        self._start = 0
+
+        # Forget the sample numbers of dropped samples
+        first = self._appended - self._size
+        for gpu_id, parts in list(self._gpu_rows.items()):
+            numbers = np.concatenate(parts)
+            numbers = numbers[np.searchsorted(numbers, first):]
+            if len(numbers):
+                self._gpu_rows[gpu_id] = [numbers]
+            else:
+                del self._gpu_rows[gpu_id]
+
+    def column(self, name):
+        """Return the filled part of one column, oldest first."""
+        return self._columns[name][self._start:self._start + self._size]
+
+    def take(self, indices, names=None):
+        """Return {field: array} for the samples at the given indices.
+
+        names limits the result to those fields; by default all are copied.
+        """
+        indices = np.asarray(indices) + self._start
+        if names is None:
+            names = self._columns
+        return {name: self._columns[name][indices] for name in names}
+
+    def row(self, i):
+        """Return sample i as a dict of Python scalars."""
+        i += self._start
+        return {name: column[i] if column.dtype == object else column[i].item()
+                for name, column in self._columns.items()}
+
+    def gpu_rows(self, gpu_id, lo=0, hi=None):
+        """Return the indices of gpu_id's samples within lo..hi-1, ascending."""
+        parts = self._gpu_rows.get(gpu_id)
+        if not parts:
+            return np.empty(0, dtype=np.intp)
+        if len(parts) > 1:
+            parts[:] = [np.concatenate(parts)]
+        numbers = parts[0]
+        if hi is None:
+            hi = self._size
+        base = self._appended - self._size  # Sample number of row 0
+        return numbers[np.searchsorted(numbers, base + lo):
+                       np.searchsorted(numbers, base + hi)] - base
+
+    @property
+    def gpu_ids(self):
+        """Sorted ids of the GPUs that have samples."""
+        return sorted(self._gpu_rows)
+
+    def window(self, start, end):
+        """Return (lo, hi) such that samples lo..hi-1 lie in [start, end]."""
+        ts = self.column('_ts')
+        lo = np.searchsorted(ts, np.datetime64(start, 'us'))
+        hi = np.searchsorted(ts, np.datetime64(end, 'us'), side='right')
+        return int(lo), int(hi)
+
+    @property
+    def first_ts(self):
+        return self._columns['_ts'][self._start].item()
+
+    @property
+    def last_ts(self):
+        return self._columns['_ts'][self._start + self._size - 1].item()
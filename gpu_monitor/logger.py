@@ -1,23 +1,102 @@
+import atexit
+import math
+import os
+import select
 import subprocess
-import csv
 import time
 from pathlib import Path
-from datetime import datetime
 import re
 
+from .ringlog import DEFAULT_RING_SLOTS, RingLogWriter
+
 try:
     import psutil
     HAS_PSUTIL = True
 except ImportError:
     HAS_PSUTIL = False
 
+try:
+    import pynvml
+    HAS_PYNVML = True
+except ImportError:
+    HAS_PYNVML = False
+
+try:
+    import pydcgm
+    import dcgm_fields
+    import dcgm_structs
+    HAS_DCGM = True
+except ImportError:
+    HAS_DCGM = False
+
+# Re-resolve process names at least this often (in samples), even when the
+# set of compute processes is unchanged, so renamed workers are picked up
+PROCESS_REFRESH_TICKS = 5
+
+# Patterns used by extract_process_name for every process it resolves
+_RAY_RE = re.compile(r'ray::([a-zA-Z0-9_.\-:]+)')
+_PY_RE = re.compile(r'(\w+\.py)')
+
+# Interpreter names that resolve_process_name replaces with the script name
+_PY_EXE_NAMES = frozenset(('python', 'python3', 'python2'))
+
+# Command lines are read straight from procfs where it exists (Linux)
+_HAS_PROCFS = os.path.isdir('/proc/self')
+
+# Trailing DCGM-only columns for rows from the other backends
+_NO_DCGM_FIELDS = ('', '', '', '')
+
+# Fields sampled by the nvidia-smi fallback, in csv_headers order
+_SMI_QUERY_GPU = ('--query-gpu=timestamp,index,utilization.gpu,memory.used,'
+                  'memory.total,temperature.gpu,power.draw')
+
+# One CSV line per row; every field except process_info is a plain number
+_ROW_FMT = '{},{},{},{},{},{},{},{},{},{},{},{}\n'.format
+
+
+def _read_cmdline(proc):
+    """Return a process's command line as one space-separated string.
+
+    Reads /proc/<pid>/cmdline directly where available; the first 4 KiB is
+    plenty for extract_process_name.
+    """
+    if not _HAS_PROCFS:
+        return ' '.join(proc.cmdline())
+    try:
+        fd = os.open(f'/proc/{proc.pid}/cmdline', os.O_RDONLY)
+    except FileNotFoundError:
+        raise psutil.NoSuchProcess(proc.pid)
+    except PermissionError:
+        raise psutil.AccessDenied(proc.pid)
+    try:
+        data = os.read(fd, 4096)
+    finally:
+        os.close(fd)
+    return data.rstrip(b'\0').replace(b'\0', b' ').decode(errors='replace')
+
+
+def _format_timestamp(t):
+    """Format epoch seconds like nvidia-smi's timestamp, with milliseconds."""
+    return '{}.{:03d}'.format(time.strftime('%Y/%m/%d %H:%M:%S', time.localtime(t)),
+                              int(t * 1000) % 1000)
+
+
+def _quote_csv_field(value):
+    """Quote a free-text CSV field the way csv.writer would, if needed."""
+    if any(c in value for c in ',"\r\n'):
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
 
 class GPULogger:
-    """Logs NVIDIA GPU metrics to CSV file."""
+    """Logs NVIDIA GPU metrics to a CSV file or a binary ring log."""
 
-    def __init__(self, output_file, interval=1.0):
+    def __init__(self, output_file, interval=1.0, log_format='csv',
+                 ring_slots=DEFAULT_RING_SLOTS):
         self.output_file = Path(output_file)
         self.interval = interval
+        self.log_format = log_format
+        self.ring_slots = ring_slots
         self.csv_headers = [
             'timestamp',
             'gpu_id',
@@ -26,31 +105,263 @@ class GPULogger:
             'memory_total',
             'temperature',
             'power_draw',
-            'process_info'
+            'process_info',
+            'sm_active',
+            'sm_occupancy',
+            'pcie_rx_bytes',
+            'pcie_tx_bytes'
         ]
         self.gpu_uuid_map = None
+        self._handles = None
+        self._dcgm = None
+        self._proc_cache = {}
+        self._proc_cache_pids = frozenset()
+        self._proc_cache_tick = 0
+        self._cmdline_cache = {}  # pid -> (create_time, resolved name)
+        self._smi_proc = None
+        self._smi_buf = b''
+        self._smi_gpus = 0
+        # Last parsed nvidia-smi sample: (output minus timestamps, processes, rows)
+        self._last_smi = (None, None, None)
+        self._init_nvml()
+        self._init_dcgm()
+
+    def _init_nvml(self):
+        """Open persistent NVML device handles, if pynvml is available.
+
+        Leaves self._handles as None when NVML can't be used, in which case
+        sampling falls back to the nvidia-smi subprocess path.
+        """
+        if not HAS_PYNVML:
+            return
+        try:
+            pynvml.nvmlInit()
+        except pynvml.NVMLError:
+            return
+        atexit.register(pynvml.nvmlShutdown)
+        try:
+            self._handles = [pynvml.nvmlDeviceGetHandleByIndex(i)
+                             for i in range(pynvml.nvmlDeviceGetCount())]
+        except pynvml.NVMLError:
+            self._handles = None
+            return
+        # Devices that report power as unsupported are skipped on later ticks
+        # rather than raising (and unwinding) on every sample
+        self._power_supported = [True] * len(self._handles)
+
+    def _init_dcgm(self):
+        """Subscribe to DCGM profiling fields, if DCGM is available.
+
+        DCGM samples the watched fields itself at the logging interval, so
+        each tick only reads the latest cached values. Leaves self._dcgm as
+        None when no host engine can be reached.
+        """
+        if not HAS_DCGM:
+            return
+        field_ids = [
+            dcgm_fields.DCGM_FI_DEV_GPU_UTIL,
+            dcgm_fields.DCGM_FI_DEV_FB_USED,
+            dcgm_fields.DCGM_FI_DEV_FB_TOTAL,
+            dcgm_fields.DCGM_FI_DEV_GPU_TEMP,
+            dcgm_fields.DCGM_FI_DEV_POWER_USAGE,
+            dcgm_fields.DCGM_FI_PROF_SM_ACTIVE,
+            dcgm_fields.DCGM_FI_PROF_SM_OCCUPANCY,
+            dcgm_fields.DCGM_FI_PROF_PCIE_RX_BYTES,
+            dcgm_fields.DCGM_FI_PROF_PCIE_TX_BYTES,
+        ]
+        name = f'gpu_monitor_{os.getpid()}'
+        try:
+            handle = pydcgm.DcgmHandle(opMode=dcgm_structs.DCGM_OPERATION_MODE_AUTO)
+            group = pydcgm.DcgmGroup(handle, groupName=name,
+                                     groupType=dcgm_structs.DCGM_GROUP_DEFAULT)
+            field_group = pydcgm.DcgmFieldGroup(handle, name=name, fieldIds=field_ids)
+            group.samples.WatchFields(field_group, int(self.interval * 1e6), 60.0, 0)
+            handle.GetSystem().UpdateAllFields(True)
+            gpu_ids = group.GetGpuIds()
+        except dcgm_structs.DCGMError:
+            return
+
+        def _shutdown():
+            try:
+                field_group.Delete()
+                group.Delete()
+                handle.Shutdown()
+            except dcgm_structs.DCGMError:
+                pass
+
+        atexit.register(_shutdown)
+        self._dcgm = (handle, group, field_group, gpu_ids)
+
+    def sample(self):
+        """Collect one row per GPU for the current tick."""
+        gpu_processes = self.get_gpu_processes()
+        if self._dcgm is not None:
+            return self.query_dcgm(gpu_processes)
+        if self._handles is not None:
+            return self.query_nvml(gpu_processes)
+        output = self.query_nvidia_smi()
+        return self.parse_nvidia_output(output, gpu_processes)
+
+    def query_dcgm(self, gpu_processes):
+        """Drain the latest watched DCGM values into one row per GPU."""
+        _, group, field_group, gpu_ids = self._dcgm
+        timestamp = _format_timestamp(time.time())
+        values = group.samples.GetLatest(field_group).values
+
+        def latest(gpu_values, field_id, fmt):
+            series = gpu_values.get(field_id)
+            if not series or not series.values:
+                return ''
+            value = series.values[-1]
+            if value.isBlank:
+                return ''
+            return fmt.format(value.value)
+
+        rows = []
+        for gpu_id in gpu_ids:
+            gpu_values = values.get(gpu_id)
+            if not gpu_values:
+                continue
+            rows.append((
+                timestamp,
+                str(gpu_id),
+                latest(gpu_values, dcgm_fields.DCGM_FI_DEV_GPU_UTIL, '{}'),
+                latest(gpu_values, dcgm_fields.DCGM_FI_DEV_FB_USED, '{}'),
+                latest(gpu_values, dcgm_fields.DCGM_FI_DEV_FB_TOTAL, '{}'),
+                latest(gpu_values, dcgm_fields.DCGM_FI_DEV_GPU_TEMP, '{}'),
+                latest(gpu_values, dcgm_fields.DCGM_FI_DEV_POWER_USAGE, '{:.2f}'),
+                gpu_processes.get(gpu_id, ''),
+                latest(gpu_values, dcgm_fields.DCGM_FI_PROF_SM_ACTIVE, '{:.3f}'),
+                latest(gpu_values, dcgm_fields.DCGM_FI_PROF_SM_OCCUPANCY, '{:.3f}'),
+                latest(gpu_values, dcgm_fields.DCGM_FI_PROF_PCIE_RX_BYTES, '{}'),
+                latest(gpu_values, dcgm_fields.DCGM_FI_PROF_PCIE_TX_BYTES, '{}'),
+            ))
+        return rows
+
+    def query_nvml(self, gpu_processes):
+        """Read GPU metrics from the cached NVML handles.
+
+        Produces the same row tuples as parse_nvidia_output, with values formatted
+        the way nvidia-smi reports them (MiB, watts, nvidia-smi timestamp).
+        """
+        timestamp = _format_timestamp(time.time())
+        rows = []
+        for gpu_id, handle in enumerate(self._handles):
+            try:
+                util = pynvml.nvmlDeviceGetUtilizationRates(handle)
+                mem = pynvml.nvmlDeviceGetMemoryInfo(handle)
+                temp = pynvml.nvmlDeviceGetTemperature(handle, pynvml.NVML_TEMPERATURE_GPU)
+            except pynvml.NVMLError:
+                continue
+            power = ''
+            if self._power_supported[gpu_id]:
+                try:
+                    power = f"{pynvml.nvmlDeviceGetPowerUsage(handle) / 1000:.2f}"
+                except pynvml.NVMLError_NotSupported:
+                    self._power_supported[gpu_id] = False
+                except pynvml.NVMLError:
+                    pass
+            rows.append((
+                timestamp,
+                str(gpu_id),
+                str(util.gpu),
+                str(mem.used // (1024 * 1024)),
+                str(mem.total // (1024 * 1024)),
+                str(temp),
+                power,
+                gpu_processes.get(gpu_id, ''),
+            ) + _NO_DCGM_FIELDS)
+        return rows
 
     def query_nvidia_smi(self):
-        """Query nvidia-smi for GPU metrics."""
+        """Query nvidia-smi for GPU metrics.
+
+        The first call runs nvidia-smi once to learn the GPU count, then
+        starts a streaming `nvidia-smi -lms` process that later calls read
+        from, instead of forking a new nvidia-smi every sample.
+        """
+        if self._smi_proc is not None:
+            return self._read_smi_stream()
+
         try:
             result = subprocess.run(
-                [
-                    'nvidia-smi',
-                    '--query-gpu=timestamp,index,utilization.gpu,memory.used,memory.total,temperature.gpu,power.draw',
-                    '--format=csv,noheader,nounits'
-                ],
+                ['nvidia-smi', _SMI_QUERY_GPU, '--format=csv,noheader,nounits'],
                 capture_output=True,
                 text=True,
                 check=True
             )
-            return result.stdout.strip()
         except subprocess.CalledProcessError as e:
             raise RuntimeError(f"nvidia-smi failed: {e.stderr}")
         except FileNotFoundError:
             raise RuntimeError("nvidia-smi not found. Is NVIDIA driver installed?")
 
+        output = result.stdout.strip()
+        self._smi_gpus = len(output.splitlines())
+        if self._smi_gpus:
+            self._start_smi_stream()
+        return output
+
+    def _start_smi_stream(self):
+        """Start a long-lived nvidia-smi emitting one sample per interval."""
+        self._smi_proc = subprocess.Popen(
+            ['nvidia-smi', _SMI_QUERY_GPU, '--format=csv,noheader,nounits',
+             '-lms', str(max(1, int(self.interval * 1000)))],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        os.set_blocking(self._smi_proc.stdout.fileno(), False)
+        atexit.unregister(self._stop_smi_stream)
+        atexit.register(self._stop_smi_stream)
+
+    def _stop_smi_stream(self):
+        if self._smi_proc is not None:
+            self._smi_proc.terminate()
+            self._smi_proc.wait()
+            self._smi_proc.stdout.close()
+            self._smi_proc = None
+
+    def _read_smi_stream(self):
+        """Return the newest complete sample from the streaming nvidia-smi.
+
+        Drains everything buffered so a slow reader never falls behind, and
+        blocks only when less than a full sample is available, for at most
+        about one interval so the sampling loop can still notice a stop.
+        """
+        fd = self._smi_proc.stdout.fileno()
+        timeout = max(self.interval, 1.0)
+        while True:
+            try:
+                chunk = os.read(fd, 65536)
+            except BlockingIOError:
+                chunk = None
+            if chunk == b'':
+                self._stop_smi_stream()
+                raise RuntimeError("nvidia-smi stream exited")
+            if chunk:
+                self._smi_buf += chunk
+                continue
+
+            lines = self._smi_buf.split(b'\n')
+            # The last element is an incomplete line (or empty). Samples are
+            # self._smi_gpus lines each; lines past the last whole sample
+            # belong to the next one and stay buffered
+            complete = lines[:-1]
+            whole = len(complete) - len(complete) % self._smi_gpus
+            if whole:
+                self._smi_buf = b'\n'.join(complete[whole:] + lines[-1:])
+                return b'\n'.join(complete[whole - self._smi_gpus:whole]).decode()
+            if not select.select([fd], [], [], timeout)[0]:
+                raise RuntimeError("nvidia-smi stream stalled")
+
     def build_gpu_uuid_map(self):
         """Build mapping from GPU UUID to GPU index."""
+        if self._handles is not None:
+            try:
+                return {pynvml.nvmlDeviceGetUUID(handle): gpu_id
+                        for gpu_id, handle in enumerate(self._handles)}
+            except pynvml.NVMLError:
+                return {}
+
         try:
             result = subprocess.run(
                 [
@@ -76,7 +387,29 @@ class GPULogger:
             return {}
 
     def get_gpu_processes(self):
-        """Get process information for all GPUs."""
+        """Get process information for all GPUs.
+
+        Cached between samples: names are only re-resolved when the set of
+        compute processes changes or every PROCESS_REFRESH_TICKS samples.
+        """
+        refresh_due = self._proc_cache_tick % PROCESS_REFRESH_TICKS == 0
+
+        if self._handles is not None:
+            gpu_pids = self._get_gpu_pids_nvml()
+            pid_set = frozenset(gpu_pids)
+            if pid_set != self._proc_cache_pids or refresh_due:
+                self._proc_cache = self._get_gpu_processes_nvml(gpu_pids)
+                self._proc_cache_pids = pid_set
+            return self._proc_cache
+
+        # Listing processes without NVML costs an nvidia-smi call, so just
+        # refresh on the coarser cadence
+        if refresh_due:
+            self._proc_cache = self._get_gpu_processes_smi()
+        return self._proc_cache
+
+    def _get_gpu_processes_smi(self):
+        """Get process information for all GPUs via nvidia-smi."""
         if self.gpu_uuid_map is None:
             self.gpu_uuid_map = self.build_gpu_uuid_map()
 
@@ -93,6 +426,9 @@ class GPULogger:
             )
 
             gpu_processes = {}  # gpu_id -> process_info
+            live_pids = set()
+            uuid_to_gpu = self.gpu_uuid_map.get
+            resolvable = _PY_EXE_NAMES if HAS_PSUTIL else frozenset()
 
             for line in result.stdout.strip().split('\n'):
                 if not line.strip():
@@ -101,46 +437,99 @@ class GPULogger:
                 parts = [p.strip() for p in line.split(',')]
                 if len(parts) >= 3:
                     pid = int(parts[0])
+                    live_pids.add(pid)
                     process_name = parts[1]
                     gpu_uuid = parts[2]
-                    gpu_id = self.gpu_uuid_map.get(gpu_uuid)
+                    gpu_id = uuid_to_gpu(gpu_uuid)
 
                     if gpu_id is not None:
-                        # nvidia-smi already gives us ray::function_name, use it directly
-                        # If psutil is available, try to get more details
-                        if HAS_PSUTIL:
-                            try:
-                                proc = psutil.Process(pid)
-                                cmdline = ' '.join(proc.cmdline())
-                                # If process_name is just "python", try to extract from cmdline
-                                if process_name in ['python', 'python3', 'python2']:
-                                    extracted = self.extract_process_name(cmdline)
-                                    if extracted and extracted != cmdline[:30]:
-                                        process_name = extracted
-                            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                                pass
-
-                        # Store per GPU (if multiple processes, combine with semicolon)
-                        if gpu_id in gpu_processes:
-                            gpu_processes[gpu_id] += f"; {process_name}"
-                        else:
-                            gpu_processes[gpu_id] = process_name
+                        if process_name in resolvable:
+                            process_name = self.resolve_process_name(pid, process_name)
+                        self._add_process(gpu_processes, gpu_id, process_name)
 
+            self._evict_cmdline_cache(live_pids)
             return gpu_processes
 
         except Exception as e:
             # Return empty dict on error, don't crash
             return {}
 
+    def _get_gpu_pids_nvml(self):
+        """List (gpu_id, pid) pairs of compute processes from the NVML handles."""
+        gpu_pids = []
+        for gpu_id, handle in enumerate(self._handles):
+            try:
+                procs = pynvml.nvmlDeviceGetComputeRunningProcesses(handle)
+            except pynvml.NVMLError:
+                continue
+            gpu_pids.extend((gpu_id, proc.pid) for proc in procs)
+        return gpu_pids
+
+    def _get_gpu_processes_nvml(self, gpu_pids):
+        """Resolve process names for (gpu_id, pid) pairs."""
+        gpu_processes = {}  # gpu_id -> process_info
+        resolvable = _PY_EXE_NAMES if HAS_PSUTIL else frozenset()
+
+        for gpu_id, pid in gpu_pids:
+            try:
+                process_name = pynvml.nvmlSystemGetProcessName(pid)
+            except pynvml.NVMLError:
+                process_name = str(pid)
+            if process_name in resolvable:
+                process_name = self.resolve_process_name(pid, process_name)
+            self._add_process(gpu_processes, gpu_id, process_name)
+
+        self._evict_cmdline_cache({pid for _, pid in gpu_pids})
+        return gpu_processes
+
+    def resolve_process_name(self, pid, process_name):
+        """Replace a bare interpreter name with something more descriptive."""
+        # nvidia-smi already gives us ray::function_name, use it directly
+        # If process_name is just "python" and psutil is available, try to
+        # extract something better from the command line
+        if not HAS_PSUTIL or process_name not in _PY_EXE_NAMES:
+            return process_name
+
+        try:
+            proc = psutil.Process(pid)
+            # The resolved name is reused for as long as the PID refers to
+            # the same process (create_time guards against PID reuse)
+            create_time = proc.create_time()
+            cached = self._cmdline_cache.get(pid)
+            if cached is not None and cached[0] == create_time:
+                return cached[1]
+
+            cmdline = _read_cmdline(proc)
+            extracted = self.extract_process_name(cmdline)
+            if extracted and extracted != cmdline[:30]:
+                process_name = extracted
+            self._cmdline_cache[pid] = (create_time, process_name)
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            pass
+        return process_name
+
+    def _evict_cmdline_cache(self, live_pids):
+        """Drop cached names for processes no longer on any GPU."""
+        for pid in self._cmdline_cache.keys() - live_pids:
+            del self._cmdline_cache[pid]
+
+    @staticmethod
+    def _add_process(gpu_processes, gpu_id, process_name):
+        """Store per GPU (if multiple processes, combine with semicolon)."""
+        if gpu_id in gpu_processes:
+            gpu_processes[gpu_id] += f"; {process_name}"
+        else:
+            gpu_processes[gpu_id] = process_name
+
     def extract_process_name(self, cmdline):
         """Extract a meaningful process name from command line."""
         # Look for ray::function_name pattern
-        ray_match = re.search(r'ray::([a-zA-Z0-9_.\-:]+)', cmdline)
+        ray_match = _RAY_RE.search(cmdline)
         if ray_match:
             return ray_match.group(1)
 
         # Look for Python script name
-        py_match = re.search(r'(\w+\.py)', cmdline)
+        py_match = _PY_RE.search(cmdline)
         if py_match:
             return py_match.group(1)
 
@@ -148,7 +537,7 @@ class GPULogger:
         parts = cmdline.split()
         if parts:
             exe = parts[0].split('/')[-1]  # Get basename
-            if exe not in ['python', 'python3', 'python2']:
+            if exe not in _PY_EXE_NAMES:
                 return exe
 
             # If it's python, try to get the script name
@@ -162,63 +551,113 @@ class GPULogger:
         return cmdline[:30]  # Fallback: first 30 chars
 
     def parse_nvidia_output(self, output, gpu_processes):
-        """Parse nvidia-smi output into structured rows."""
-        rows = []
-        for line in output.split('\n'):
-            if not line.strip():
-                continue
+        """Parse nvidia-smi output into row tuples in csv_headers order.
+
+        On an idle GPU consecutive samples only differ in their timestamps, so
+        if the rest of the output and the process map are unchanged the
+        previous rows are reused with the new timestamps.
+        """
+        lines = output.splitlines()
+        values = [line[line.find(',') + 1:] for line in lines]
+        last_values, last_processes, last_rows = self._last_smi
+        if values == last_values and gpu_processes is last_processes:
+            return [(line[:line.find(',')].strip(),) + row[1:]
+                    for line, row in zip(lines, last_rows)]
 
-            parts = [p.strip() for p in line.split(',')]
+        rows = []
+        for line in lines:
+            parts = tuple(map(str.strip, line.split(',')))
             if len(parts) >= 7:
-                gpu_id = int(parts[1])
-                rows.append({
-                    'timestamp': parts[0],
-                    'gpu_id': parts[1],
-                    'utilization_gpu': parts[2],
-                    'memory_used': parts[3],
-                    'memory_total': parts[4],
-                    'temperature': parts[5],
-                    'power_draw': parts[6],
-                    'process_info': gpu_processes.get(gpu_id, '')
-                })
+                process_info = gpu_processes.get(int(parts[1]), '')
+                rows.append(parts[:7] + (process_info,) + _NO_DCGM_FIELDS)
 
+        # Only reusable when every line produced a row, in line order
+        if len(rows) == len(lines):
+            self._last_smi = (values, gpu_processes, rows)
         return rows
 
+    def format_rows(self, rows):
+        """Format row tuples as CSV lines."""
+        # process_info (index 7) is the only free-text field
+        return ''.join(_ROW_FMT(*row[:7], _quote_csv_field(row[7]), *row[8:])
+                       for row in rows)
+
     def start_logging(self, stop_event):
         """Main logging loop."""
+        if self.log_format == 'ring':
+            ring = RingLogWriter(self.output_file, self.ring_slots)
+            try:
+                self._sample_loop(stop_event, ring.append)
+            finally:
+                ring.close()
+            return
+
         # Create output directory if needed
         self.output_file.parent.mkdir(parents=True, exist_ok=True)
 
-        # Check if file exists to determine if we need to write headers
-        file_exists = self.output_file.exists()
-
-        with open(self.output_file, 'a', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=self.csv_headers)
-
-            # Write headers if new file
-            if not file_exists:
-                writer.writeheader()
-                f.flush()
-
-            while not stop_event.is_set():
-                try:
-                    # Query GPU metrics
-                    output = self.query_nvidia_smi()
-
-                    # Get process information
-                    gpu_processes = self.get_gpu_processes()
-
-                    # Parse with process info
-                    rows = self.parse_nvidia_output(output, gpu_processes)
-
-                    # Write to CSV
-                    for row in rows:
-                        writer.writerow(row)
-                    f.flush()
-
-                    # Wait for next interval
-                    time.sleep(self.interval)
+        # Headers are written to a new (or empty) file. Appending to a log
+        # with other columns would put rows under the wrong header
+        header = ','.join(self.csv_headers)
+        try:
+            with open(self.output_file, 'r', newline='') as f:
+                existing_header = f.readline().rstrip('\r\n')
+        except FileNotFoundError:
+            existing_header = ''
+        if existing_header and existing_header != header:
+            raise ValueError(f"{self.output_file} has different CSV columns; "
+                             "log to a new file instead")
+
+        # Raw append-only descriptor. Rows are buffered and written about
+        # once per second (every tick at intervals of 1s or more), which is
+        # as often as the live viewer polls the file
+        fd = os.open(self.output_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        flush_every = max(1, int(1.0 / self.interval))
+        pending = []
+        ticks = 0
+
+        def write_rows(rows):
+            nonlocal ticks
+            pending.append(self.format_rows(rows))
+            ticks += 1
+            if ticks % flush_every == 0:
+                os.write(fd, ''.join(pending).encode())
+                pending.clear()
 
-                except Exception as e:
-                    print(f"Error during logging: {e}")
-                    time.sleep(self.interval)
+        try:
+            if not existing_header:
+                os.write(fd, (header + '\n').encode())
+
+            self._sample_loop(stop_event, write_rows)
+        finally:
+            if pending:
+                os.write(fd, ''.join(pending).encode())
+            os.close(fd)
+
+    def _sample_loop(self, stop_event, write_rows):
+        """Sample every interval and hand each tick's rows to write_rows."""
+        # Sample on a fixed cadence: deadlines advance by the interval
+        # regardless of how long each query takes, and stop is immediate
+        next_deadline = time.monotonic() + self.interval
+        while not stop_event.is_set():
+            try:
+                # Query GPU metrics with process info
+                rows = self.sample()
+                self._proc_cache_tick += 1
+
+                if rows:
+                    write_rows(rows)
+
+            except Exception as e:
+                print(f"Error during logging: {e}")
+
+            # Wait for next interval; after an overrun, skip the missed
+            # ticks instead of sampling back-to-back to catch up
+            now = time.monotonic()
+            if now > next_deadline:
+                missed = math.ceil((now - next_deadline) / self.interval)
+                next_deadline += missed * self.interval
+            if stop_event.wait(next_deadline - now):
+                break
+            next_deadline += self.interval
+
+        self._stop_smi_stream()
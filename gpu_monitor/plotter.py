@@ -4,8 +4,25 @@ Inspired by btop's beautiful graph rendering using Unicode Braille patterns
 for much higher resolution than traditional block characters.
 """
 
+import numpy as np
+from rich.style import Style
 from rich.text import Text
+from collections import OrderedDict
+from itertools import groupby
 from datetime import datetime, timedelta
+from functools import lru_cache
+from threading import Lock
+
+__all__ = [
+    'AxisPlot',
+    'create_braille_graph',
+    'create_plot',
+    'create_progress_bar',
+    'create_sparkline',
+    'format_hms',
+    'get_gradient_color',
+    'get_gradient_colors',
+]
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -33,6 +50,21 @@ GRV_PURPLE = "color(175)"   # #d3869b
 GRV_AQUA = "color(108)"     # #8ec07c
 GRV_ORANGE = "color(208)"   # #fe8019
 
+# Styles used on every render, parsed once: a style string is looked up
+# again by Rich for every span that carries it
+BOLD_FG = Style.parse(f"bold {GRV_FG}")
+BOLD_GREEN = Style.parse(f"bold {GRV_GREEN}")
+BOLD_YELLOW = Style.parse(f"bold {GRV_YELLOW}")
+BOLD_RED = Style.parse(f"bold {GRV_RED}")
+BOLD_STYLES = {GRV_GREEN: BOLD_GREEN, GRV_YELLOW: BOLD_YELLOW, GRV_RED: BOLD_RED}
+ITALIC_PURPLE = Style.parse(f"italic {GRV_PURPLE}")
+FG4_STYLE = Style.parse(GRV_FG4)
+BG2_STYLE = Style.parse(GRV_BG2)
+BG3_STYLE = Style.parse(GRV_BG3)
+# Plain styles for the graph colors, keyed by color string
+COLOR_STYLES = {color: Style.parse(color)
+                for color in (GRV_GREEN, GRV_YELLOW, GRV_RED, GRV_AQUA)}
+
 
 # Braille patterns for high-resolution graphing
 # Each braille character is a 2x4 dot matrix, giving us 8 levels per character width
@@ -44,9 +76,89 @@ BRAILLE_MAP = [
     [0x04, 0x20],  # Row 2: dots 3, 6
     [0x40, 0x80],  # Row 3: dots 7, 8
 ]
+# Same bits flattened, indexed by dot_row * 2 + column
+BRAILLE_FLAT = tuple(bit for row in BRAILLE_MAP for bit in row)
+
+
+def _cell_column_tables(col):
+    """Bit tables for one column (0 = left, 1 = right) of a braille cell.
+
+    Index k counts dots up from the bottom of the cell: the fill table has
+    the lowest k dots lit, the line table only the k-th (k = 0: none).
+    """
+    line = [0] + [BRAILLE_FLAT[dot_row * 2 + col] for dot_row in (3, 2, 1, 0)]
+    fill = [0]
+    for bit in line[1:]:
+        fill.append(fill[-1] | bit)
+    return np.array(fill, dtype=np.intp), np.array(line, dtype=np.intp)
+
+
+# FILL_LEFT = [0x00, 0x40, 0x44, 0x46, 0x47], FILL_RIGHT = [0x00, 0x80, 0xA0, 0xB0, 0xB8]
+FILL_LEFT, LINE_LEFT = _cell_column_tables(0)
+FILL_RIGHT, LINE_RIGHT = _cell_column_tables(1)
+
+
+@lru_cache(maxsize=None)
+def _column_glyphs(height, filled):
+    """Code points of a whole character column for every pair of dot heights.
+
+    Indexed [dot_y_left, dot_y_right] -> (height,) codes, top row first.
+    A column's glyphs depend only on its two dot heights, so they are
+    computed once per plot height and reused by every column of every frame.
+    """
+    dot_y = np.arange(height * 4)
+    # Offset of each dot height above the bottom dot of each character row:
+    # offset[dot_y, row]. Only offsets 0-3 fall inside that row's cell
+    row_bottom = (height - 1 - np.arange(height)) * 4
+    offset = dot_y[:, None] - row_bottom[None, :]
+
+    if filled:
+        # The dots lit in a filled cell are a contiguous run from its bottom
+        k = np.clip(offset + 1, 0, 4)
+        left, right = FILL_LEFT[k], FILL_RIGHT[k]
+    else:
+        k = np.where((offset >= 0) & (offset < 4), offset + 1, 0)
+        left, right = LINE_LEFT[k], LINE_RIGHT[k]
+    # Code points stored as little-endian UTF-32 units so a run of them
+    # decodes straight into a string
+    table = (BRAILLE_OFFSET | left[:, None, :] | right[None, :, :]).astype('<u4')
+    table.flags.writeable = False
+    return table
+
+
+@lru_cache(maxsize=None)
+def _flat_rows(width, height):
+    """Rows of a graph whose points all sit on the bottom dot, top row first."""
+    blank = chr(BRAILLE_OFFSET) * width
+    bottom = chr(BRAILLE_OFFSET | FILL_LEFT[1] | FILL_RIGHT[1]) * width
+    return (blank,) * (height - 1) + (bottom,)
+
+
+def _resample(values, target_points):
+    """Pick or pad values to exactly target_points, keeping the dtype."""
+    if len(values) > target_points:
+        # Evenly spaced samples spanning the whole series, newest included
+        return values[np.linspace(0, len(values) - 1, target_points).astype(np.intp)]
+    if len(values) < target_points:
+        # Pad with first value at the beginning (older data)
+        return np.concatenate(
+            [np.full(target_points - len(values), values[0]), values])
+    return values
+
 
+def _braille_kernel(normalized, width, height, filled):
+    """Rasterize 2*width normalized (0-1) values into braille code points.
 
-def create_braille_graph(values, width, height, color=None, filled=True, per_column_color=False, raw_values=None, value_max=100, return_lines=False):
+    Returns a (height, width) array of UTF-32 code units, top row first.
+    """
+    # Dot height of each data point (0 = bottom, height*4-1 = top),
+    # paired up per character column
+    dot_y = (normalized * (height * 4 - 1)).astype(np.intp)
+    np.clip(dot_y, 0, height * 4 - 1, out=dot_y)
+    return _column_glyphs(height, filled)[dot_y[0::2], dot_y[1::2]].T
+
+
+def create_braille_graph(values, width, height, color=None, filled=True, per_column_color=False, raw_values=None, value_max=100, return_lines=False, data_range=None):
     """
     Create a high-resolution graph using Braille patterns.
 
@@ -55,7 +167,7 @@ def create_braille_graph(values, width, height, color=None, filled=True, per_col
     compared to traditional block characters.
 
     Args:
-        values: List of numeric values to plot
+        values: Sequence or NumPy array of numeric values to plot
         width: Width in characters
         height: Height in characters
         color: Color for the graph (used if per_column_color=False). Defaults to Gruvbox aqua.
@@ -64,114 +176,90 @@ def create_braille_graph(values, width, height, color=None, filled=True, per_col
         raw_values: Original values for coloring (before normalization)
         value_max: Maximum value for color scaling (e.g., 100 for percentage, 80 for GB)
         return_lines: If True, return list of Text objects (one per line) instead of single Text
+        data_range: (min, max) of values, if already known
     """
     if color is None:
         color = GRV_AQUA
 
-    if not values or width < 1 or height < 1:
-        return Text("No data", style=GRV_FG4)
+    if len(values) == 0 or width < 1 or height < 1:
+        return Text("No data", style=FG4_STYLE)
+
+    # Range of the whole series, taken in its stored dtype (compact integer
+    # histories stay compact until after resampling)
+    series = values
+    values = np.asarray(values)
+    if data_range is None:
+        min_val, max_val = float(values.min()), float(values.max())
+    else:
+        min_val, max_val = data_range
+
+    # Colors follow the plotted series itself unless other raw values are given
+    own_colors = raw_values is None or raw_values is series
+
+    # Constant series (idle GPU): every point sits on the bottom dot, so the
+    # rows and the single column color are known without rasterizing
+    if max_val == min_val and own_colors:
+        if per_column_color:
+            color = get_gradient_color(min(max_val / value_max, 1.0))
+        style = COLOR_STYLES.get(color, color)
+        lines = [Text(row, style=style) for row in _flat_rows(width, height)]
+        if return_lines:
+            return lines
+        return Text("\n").join(lines)
 
-    # Normalize values to 0-1 range for plotting
-    min_val = min(values)
-    max_val = max(values)
     val_range = max_val - min_val if max_val != min_val else 1
-    normalized = [(v - min_val) / val_range for v in values]
-
-    # Keep raw values for coloring (use original values if provided)
-    color_values = raw_values if raw_values is not None else values
-
-    # Resample to fit width (2 data points per braille character)
-    target_points = width * 2
-    if len(normalized) > target_points:
-        step = len(normalized) / target_points
-        normalized = [normalized[int(i * step)] for i in range(target_points)]
-        color_values = [color_values[int(i * step)] for i in range(target_points)]
-    elif len(normalized) < target_points:
-        # Pad with first value at the beginning (older data)
-        padding_n = [normalized[0]] * (target_points - len(normalized))
-        padding_c = [color_values[0]] * (target_points - len(color_values))
-        normalized = padding_n + normalized
-        color_values = padding_c + color_values
-
-    # Total vertical dots = height * 4 (4 dots per braille row)
-    total_dots_v = height * 4
-
-    # Build the graph row by row (top to bottom)
-    # Store both characters and their colors
-    grid = []  # grid[row][col] = (char_code, color)
-
-    for row in range(height):
-        row_data = []
-        for col in range(width):
-            char_code = BRAILLE_OFFSET
-
-            # Get 2 data points for this character
-            idx1 = col * 2
-            idx2 = col * 2 + 1
-
-            v1 = normalized[idx1] if idx1 < len(normalized) else 0
-            v2 = normalized[idx2] if idx2 < len(normalized) else 0
-
-            # Convert normalized values to dot positions (0 = bottom, total_dots_v-1 = top)
-            dot_y1 = int(v1 * (total_dots_v - 1))
-            dot_y2 = int(v2 * (total_dots_v - 1))
-
-            # Check each of the 4 dot rows in this character row
-            for dot_row in range(4):
-                # Calculate the actual dot position from top (row 0 = top)
-                dot_pos = (height - 1 - row) * 4 + (3 - dot_row)
-
-                if filled:
-                    # Filled mode: light up all dots at or below the line
-                    if dot_pos <= dot_y1:
-                        char_code |= BRAILLE_MAP[dot_row][0]
-                    if dot_pos <= dot_y2:
-                        char_code |= BRAILLE_MAP[dot_row][1]
-                else:
-                    # Line mode: only light up dots on the line
-                    if dot_pos == dot_y1 or (dot_row < 3 and dot_pos < dot_y1 and (height - 1 - row) * 4 + (3 - dot_row - 1) > dot_y1):
-                        char_code |= BRAILLE_MAP[dot_row][0]
-                    if dot_pos == dot_y2 or (dot_row < 3 and dot_pos < dot_y2 and (height - 1 - row) * 4 + (3 - dot_row - 1) > dot_y2):
-                        char_code |= BRAILLE_MAP[dot_row][1]
-
-            # Determine color for this column based on actual value (not normalized)
-            # Use MAX of the two values so the visible peak determines the color
-            if per_column_color:
-                c1 = color_values[idx1] if idx1 < len(color_values) else 0
-                c2 = color_values[idx2] if idx2 < len(color_values) else 0
-                max_raw = max(c1, c2)
-                # Scale to 0-1 range based on value_max
-                scaled = min(max_raw / value_max, 1.0)
-                col_color = get_gradient_color(scaled)
-            else:
-                col_color = color
 
-            row_data.append((chr(char_code), col_color))
+    # Resample to fit width (2 data points per braille character), then
+    # normalize to 0-1 range for plotting
+    points = _resample(values, width * 2).astype(np.float64)
+    normalized = (points - min_val) / val_range
+
+    char_codes = _braille_kernel(normalized, width, height, filled)
 
-        grid.append(row_data)
+    # Determine color for each column based on actual value (not normalized)
+    # Use MAX of the two values so the visible peak determines the color.
+    # Consecutive columns of the same color form one styled run
+    if per_column_color:
+        if own_colors:
+            color_values = points
+        else:
+            color_values = _resample(np.asarray(raw_values), width * 2).astype(np.float64)
+        peaks = color_values.reshape(width, 2).max(axis=1)
+        scaled = np.minimum(peaks / value_max, 1.0)
+        runs = []  # (start column, end column, style)
+        start = 0
+        for col_color, group in groupby(get_gradient_colors(scaled).tolist()):
+            end = start + sum(1 for _ in group)
+            runs.append((start, end, COLOR_STYLES[col_color]))
+            start = end
+    else:
+        runs = [(0, width, COLOR_STYLES.get(color, color))]
 
+    # One line of braille characters per character row, top to bottom
+    chars = char_codes.tobytes().decode('utf-32-le')
+    rows = [chars[i:i + width] for i in range(0, height * width, width)]
+
+    lines = [Text.assemble(*[(row[start:end], style) for start, end, style in runs])
+             for row in rows]
     if return_lines:
         # Return list of Text objects, one per line
-        lines = []
-        for row_data in grid:
-            line_text = Text()
-            for char, col_color in row_data:
-                line_text.append(char, style=col_color)
-            lines.append(line_text)
         return lines
-    else:
-        # Return single Text with newlines
-        text = Text()
-        for i, row_data in enumerate(grid):
-            for char, col_color in row_data:
-                text.append(char, style=col_color)
-            if i < len(grid) - 1:
-                text.append("\n")
-        return text
+    # Return single Text with newlines
+    return Text("\n").join(lines)
+
+
+# Default gradient by quarter of the 0-1 range: <0.5 green, <0.75 yellow, else red
+GRADIENT_LUT = (GRV_GREEN, GRV_GREEN, GRV_YELLOW, GRV_RED, GRV_RED)
+GRADIENT_COLORS = np.array(GRADIENT_LUT, dtype=object)
 
 
 def get_gradient_color(value, low_color=None, mid_color=None, high_color=None):
     """Get color based on value (0-1 range). Uses Gruvbox colors by default."""
+    if low_color is None and mid_color is None and high_color is None:
+        if value != value:
+            return GRADIENT_LUT[-1]  # NaN fails every threshold: high color
+        return GRADIENT_LUT[int(min(max(value * 4, 0), 4))]
+
     if low_color is None:
         low_color = GRV_GREEN
     if mid_color is None:
@@ -187,61 +275,76 @@ def get_gradient_color(value, low_color=None, mid_color=None, high_color=None):
         return high_color
 
 
+def get_gradient_colors(values):
+    """Vectorized get_gradient_color: default colors for an array of 0-1 values."""
+    # Clamp before the integer cast; NaN maps to the high color like above
+    scaled = np.clip(np.nan_to_num(values * 4, nan=4.0), 0, 4)
+    return GRADIENT_COLORS[scaled.astype(np.intp)]
+
+
+SPARK_BLOCKS = " ▁▂▃▄▅▆▇█"
+# Code points as little-endian UTF-32 units, so a gathered run decodes
+# straight into a string
+SPARK_CODES = np.array([ord(c) for c in SPARK_BLOCKS], dtype='<u4')
+
+
 def create_sparkline(values, width=20, color=None):
     """Create a compact sparkline using block characters. Uses Gruvbox aqua by default."""
     if color is None:
         color = GRV_AQUA
 
-    if not values:
-        return Text("─" * width, style=GRV_FG4)
+    if len(values) == 0:
+        return Text("─" * width, style=FG4_STYLE)
 
-    blocks = " ▁▂▃▄▅▆▇█"
-    min_val = min(values)
-    max_val = max(values)
+    values = np.asarray(values)
+    min_val = float(values.min())
+    max_val = float(values.max())
     val_range = max_val - min_val if max_val != min_val else 1
 
     # Resample to width
     if len(values) > width:
-        step = len(values) / width
-        values = [values[int(i * step)] for i in range(width)]
+        values = values[np.linspace(0, len(values) - 1, width).astype(np.intp)]
 
-    spark = []
-    for v in values:
-        normalized = (v - min_val) / val_range
-        idx = min(int(normalized * (len(blocks) - 1)), len(blocks) - 1)
-        spark.append(blocks[idx])
+    normalized = (values.astype(np.float64) - min_val) / val_range
+    idx = np.minimum((normalized * (len(SPARK_BLOCKS) - 1)).astype(np.intp),
+                     len(SPARK_BLOCKS) - 1)
+    spark = SPARK_CODES[idx].tobytes().decode('utf-32-le')
 
-    # Pad if needed
-    while len(spark) < width:
-        spark.insert(0, blocks[0])
+    # Pad on the left (older side) if there are fewer values than width
+    return Text(spark.rjust(width, SPARK_BLOCKS[0]), style=COLOR_STYLES.get(color, color))
 
-    return Text(''.join(spark), style=color)
+
+@lru_cache(maxsize=None)
+def _bar_parts(width):
+    """(filled, empty) progress bar strings for every filled cell count."""
+    return tuple(("█" * i, "░" * (width - i)) for i in range(width + 1))
 
 
 def create_progress_bar(value, max_value, width=20, show_percent=True):
     """Create a beautiful gradient progress bar with Gruvbox colors."""
     if max_value <= 0:
-        return Text("─" * width, style=GRV_FG4)
+        return Text("─" * width, style=FG4_STYLE)
 
     percent = min(value / max_value, 1.0)
-    filled = int(width * percent)
+    filled = max(int(width * percent), 0)
+    filled_bar, empty_bar = _bar_parts(width)[filled]
 
     # Gradient colors based on percentage - Gruvbox colors
     if percent < 0.5:
         filled_color = GRV_GREEN
-        text_color = f"bold {GRV_GREEN}"
+        text_color = BOLD_GREEN
     elif percent < 0.75:
         filled_color = GRV_YELLOW
-        text_color = f"bold {GRV_YELLOW}"
+        text_color = BOLD_YELLOW
     else:
         filled_color = GRV_RED
-        text_color = f"bold {GRV_RED}"
+        text_color = BOLD_RED
 
     text = Text()
     # Filled portion with gradient effect
-    text.append("█" * filled, style=filled_color)
+    text.append(filled_bar, style=COLOR_STYLES[filled_color])
     # Empty portion - Gruvbox bg2
-    text.append("░" * (width - filled), style=GRV_BG2)
+    text.append(empty_bar, style=BG2_STYLE)
 
     if show_percent:
         text.append(f" {percent*100:5.1f}%", style=text_color)
@@ -249,6 +352,25 @@ def create_progress_bar(value, max_value, width=20, show_percent=True):
     return text
 
 
+@lru_cache(maxsize=None)
+def _border(plot_width, kind):
+    """Top or bottom frame line of a plot area plot_width characters wide."""
+    if kind == "top":
+        return "┌" + "─" * plot_width + "┐"
+    return "└" + "─" * plot_width + "┘"
+
+
+def format_hms(ts):
+    """Format a datetime as HH:MM:SS without going through strftime."""
+    return f"{ts.hour:02d}:{ts.minute:02d}:{ts.second:02d}"
+
+
+def _stats(values):
+    """Return (min, max, mean, last) of a non-empty array as Python floats."""
+    return (float(values.min()), float(values.max()),
+            float(values.mean()), float(values[-1]))
+
+
 class AxisPlot:
     """Creates a beautiful plot with labeled axes using Braille patterns."""
 
@@ -258,30 +380,41 @@ class AxisPlot:
         self.y_axis_width = 7
         self.plot_width = width - self.y_axis_width - 1
 
+        # Fixed pieces of every frame, built once per plotter
+        self._top_border = _border(self.plot_width, "top")
+        self._bot_border = _border(self.plot_width, "bottom")
+        self._pad = " " * self.y_axis_width
+        self._y_axis_empty = "      │"
+
     def render(self, values, timestamps, y_label, y_unit, min_val=None, max_val=None,
-               color=None, process_names=None, color_max=100):
-        """Render a beautiful plot with axes using Gruvbox colors."""
+               color=None, process_names=None, color_max=100, stats=None):
+        """Render a beautiful plot with axes using Gruvbox colors.
+
+        stats is the (min, max, mean, last) tuple from _stats(values), if the
+        caller already has it.
+        """
         if color is None:
             color = GRV_AQUA
 
-        if not values:
-            return Text("  No data available", style=GRV_FG4)
+        if len(values) == 0:
+            return Text("  No data available", style=FG4_STYLE)
+
+        values = np.asarray(values)
+        if stats is None:
+            stats = _stats(values)
+        data_min, data_max, avg_val, current_val = stats
 
         # Calculate value range
         if min_val is None:
-            min_val = min(values)
+            min_val = data_min
         if max_val is None:
-            max_val = max(values)
+            max_val = data_max
 
         value_range = max_val - min_val
         if value_range == 0:
             value_range = 1
             max_val = min_val + 1
 
-        # Current and average values
-        current_val = values[-1]
-        avg_val = sum(values) / len(values)
-
         # Color based on value level
         level = (current_val - min_val) / value_range if value_range > 0 else 0
         value_color = get_gradient_color(level)
@@ -289,11 +422,11 @@ class AxisPlot:
         text = Text()
 
         # Title line with current value - Gruvbox styled
-        text.append(f"  {y_label}", style=f"bold {GRV_FG}")
-        text.append(f" {current_val:.1f}", style=f"bold {value_color}")
-        text.append(f"{y_unit}", style=value_color)
-        text.append(f"  avg:", style=GRV_FG4)
-        text.append(f"{avg_val:.1f}{y_unit}", style=GRV_FG4)
+        text.append(f"  {y_label}", style=BOLD_FG)
+        text.append(f" {current_val:.1f}", style=BOLD_STYLES[value_color])
+        text.append(f"{y_unit}", style=COLOR_STYLES[value_color])
+        text.append(f"  avg:", style=FG4_STYLE)
+        text.append(f"{avg_val:.1f}{y_unit}", style=FG4_STYLE)
         text.append("\n")
 
         # Top border with max value - Gruvbox styled
@@ -301,8 +434,8 @@ class AxisPlot:
             max_label = f"{max_val:5.1f}"
         else:
             max_label = f"{max_val:5.0f}"
-        text.append(f" {max_label}│", style=GRV_FG4)
-        text.append("┌" + "─" * self.plot_width + "┐", style=GRV_BG3)
+        text.append(f" {max_label}│", style=FG4_STYLE)
+        text.append(self._top_border, style=BG3_STYLE)
         text.append("\n")
 
         # Create braille graph with per-column coloring based on actual values
@@ -310,7 +443,7 @@ class AxisPlot:
         graph_lines = create_braille_graph(
             values, self.plot_width, self.height - 2, color,
             per_column_color=True, raw_values=values, value_max=color_max,
-            return_lines=True
+            return_lines=True, data_range=(data_min, data_max)
         )
 
         for i, line_text in enumerate(graph_lines):
@@ -318,14 +451,14 @@ class AxisPlot:
             if i == len(graph_lines) // 2:
                 mid_val = (max_val + min_val) / 2
                 if y_unit == "GB":
-                    text.append(f"{mid_val:6.1f}│", style=GRV_FG4)
+                    text.append(f"{mid_val:6.1f}│", style=FG4_STYLE)
                 else:
-                    text.append(f"{mid_val:6.0f}│", style=GRV_FG4)
+                    text.append(f"{mid_val:6.0f}│", style=FG4_STYLE)
             else:
-                text.append("      │", style=GRV_FG4)
+                text.append(self._y_axis_empty, style=FG4_STYLE)
 
             text.append_text(line_text)
-            text.append("│", style=GRV_BG3)
+            text.append("│", style=BG3_STYLE)
             text.append("\n")
 
         # Bottom border with min value - Gruvbox styled
@@ -333,57 +466,92 @@ class AxisPlot:
             min_label = f"{min_val:5.1f}"
         else:
             min_label = f"{min_val:5.0f}"
-        text.append(f" {min_label}│", style=GRV_FG4)
-        text.append("└" + "─" * self.plot_width + "┘", style=GRV_BG3)
+        text.append(f" {min_label}│", style=FG4_STYLE)
+        text.append(self._bot_border, style=BG3_STYLE)
         text.append("\n")
 
         # X-axis time labels - Gruvbox styled
-        if timestamps:
+        if timestamps is not None and len(timestamps):
             start_time = timestamps[0]
             end_time = timestamps[-1]
+            if isinstance(start_time, np.datetime64):
+                # Timestamp column of a columnar history
+                start_time, end_time = start_time.item(), end_time.item()
 
             if isinstance(start_time, datetime) and isinstance(end_time, datetime):
-                start_str = start_time.strftime("%H:%M:%S")
-                end_str = end_time.strftime("%H:%M:%S")
+                start_str = format_hms(start_time)
+                end_str = format_hms(end_time)
             else:
                 start_str = "start"
                 end_str = "end"
 
             # Format: "       HH:MM:SS                        HH:MM:SS"
-            padding = " " * self.y_axis_width
+            padding = self._pad
             time_line = f"{padding} {start_str}"
             gap = self.plot_width - len(start_str) - len(end_str)
             if gap > 0:
                 time_line += " " * gap
             time_line += end_str
-            text.append(time_line, style=GRV_FG4)
+            text.append(time_line, style=FG4_STYLE)
             text.append("\n")
 
         # Process info (if available) - Gruvbox styled
         if process_names:
-            unique_procs = []
-            for proc in process_names:
-                if proc and proc not in unique_procs:
-                    unique_procs.append(proc)
-
-            if unique_procs:
-                proc_str = unique_procs[-1]  # Show most recent
+            # Show most recent
+            proc_str = next((proc for proc in reversed(process_names) if proc), None)
+            if proc_str:
                 if len(proc_str) > self.width - 10:
                     proc_str = proc_str[:self.width - 13] + "..."
-                text.append(f"       ⚙ ", style=GRV_FG4)
-                text.append(proc_str, style=f"italic {GRV_PURPLE}")
+                text.append(f"       ⚙ ", style=FG4_STYLE)
+                text.append(proc_str, style=ITALIC_PURPLE)
                 text.append("\n")
 
         return text
 
 
+@lru_cache(maxsize=None)
+def _axis_plot(width, height):
+    """Shared AxisPlot per size; it only holds size-derived constants."""
+    return AxisPlot(width=width, height=height)
+
+
+# Rendered plots by input, most recently used last
+PLOT_CACHE_SIZE = 32  # e.g. 8 GPUs x 4 metrics
+_PLOT_CACHE = OrderedDict()
+_PLOT_CACHE_LOCK = Lock()  # plots are rendered from worker threads
+
+
 def create_plot(values, timestamps, metric_name, y_label, y_unit, width=50, height=6, process_names=None):
-    """Create a beautiful high-resolution plot with Gruvbox colors."""
-    if not values:
-        return Text("  No data", style=GRV_FG4)
+    """Create a beautiful high-resolution plot with Gruvbox colors.
+
+    Plots are cached by their inputs, so an unchanged history (an idle GPU,
+    or a paused view) is not re-rasterized on every refresh.
+    """
+    if len(values) == 0:
+        return Text("  No data", style=FG4_STYLE)
+
+    # Lists are converted once here. Numeric arrays (e.g. a RingBuffer view
+    # in its compact metric dtype) are used as-is; the plot only widens the
+    # points it draws
+    values = np.asarray(values)
+    if values.dtype.kind not in 'iuf':
+        values = values.astype(np.float64)
+
+    has_ts = timestamps is not None and len(timestamps) > 0
+    key = (metric_name, y_label, y_unit, width, height,
+           values.dtype.str, values.tobytes(),
+           timestamps[0] if has_ts else None,
+           timestamps[-1] if has_ts else None,
+           tuple(process_names) if process_names else None)
+    with _PLOT_CACHE_LOCK:
+        cached = _PLOT_CACHE.get(key)
+        if cached is not None:
+            _PLOT_CACHE.move_to_end(key)
+            return cached.copy()
 
     # Color thresholds based on metric type - uses Gruvbox gradient colors
-    avg = sum(values) / len(values)
+    stats = _stats(values)
+    avg = stats[2]
 
     if metric_name == "util":
         color = get_gradient_color(avg / 100)
@@ -412,5 +580,12 @@ def create_plot(values, timestamps, metric_name, y_label, y_unit, width=50, heig
         max_val = None
         color_max = 100
 
-    plotter = AxisPlot(width=width, height=height)
-    return plotter.render(values, timestamps, y_label, y_unit, min_val, max_val, color, process_names, color_max)
+    plotter = _axis_plot(width, height)
+    text = plotter.render(values, timestamps, y_label, y_unit, min_val, max_val, color, process_names,
+                          color_max, stats=stats)
+
+    with _PLOT_CACHE_LOCK:
+        _PLOT_CACHE[key] = text
+        if len(_PLOT_CACHE) > PLOT_CACHE_SIZE:
+            _PLOT_CACHE.popitem(last=False)
+    return text.copy()
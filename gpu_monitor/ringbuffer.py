@@ -0,0 +1,65 @@
+"""Fixed-capacity numeric history backed by a NumPy array.
+
+Keeps the most recent `capacity` samples of one metric so plots can be fed
+an ndarray directly instead of rebuilding a list every refresh.
+"""
+
+import numpy as np
+
+
+class RingBuffer:
+    """FIFO of the last `capacity` values with an O(1), copy-free view.
+
+    Every value is written twice, at i and i + capacity, so the newest
+    `len(self)` values are always one contiguous slice of the storage.
+    """
+
+    def __init__(self, capacity, dtype=np.float64):
+        if capacity < 1:
+            raise ValueError("RingBuffer capacity must be at least 1")
+        self.capacity = capacity
+        self._buf = np.zeros(2 * capacity, dtype=dtype)
+        self._count = 0  # total values ever appended
+
+    def __len__(self):
+        return min(self._count, self.capacity)
+
+    @property
+    def dtype(self):
+        return self._buf.dtype
+
+    def append(self, value):
+        """Add one value, dropping the oldest if full."""
+        i = self._count % self.capacity
+        self._buf[i] = self._buf[i + self.capacity] = value
+        self._count += 1
+
+    def extend(self, values):
+        """Add many values at once, dropping the oldest if full."""
+        values = np.asarray(values, dtype=self._buf.dtype)
+        if len(values) > self.capacity:
+            self._count += len(values) - self.capacity
+            values = values[-self.capacity:]
+        n = len(values)
+        if n == 0:
+            return
+        start = self._count % self.capacity
+        # Copy into both halves, splitting where the ring wraps
+        first = min(n, self.capacity - start)
+        for base in (0, self.capacity):
+            self._buf[base + start:base + start + first] = values[:first]
+            self._buf[base:base + n - first] = values[first:]
+        self._count += n
+
+    def clear(self):
+        self._count = 0
+
+    def view(self):
+        """Return the stored values, oldest first, as a read-only array view."""
+        size = len(self)
+        if size == 0:
+            return self._buf[:0]
+        end = (self._count - 1) % self.capacity + self.capacity + 1
+        view = self._buf[end - size:end]
+        view.flags.writeable = False
+        return view
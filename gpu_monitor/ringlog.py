@@ -0,0 +1,184 @@
+"""Fixed-size binary ring buffer log format.
+
+An alternative to CSV logs for long-running sessions: a preallocated file of
+fixed-width sample records that the logger overwrites oldest-first, so the
+file never grows and readers unpack records instead of parsing text.
+
+Layout:
+    header   magic, version, slot count, total rows written (head)
+    slots    `slots` packed records, row n lives in slot n % slots
+
+Process names are variable-length, so records store an index into a string
+table kept in a sidecar file (`<log>.procs`, one name per line, line 0 = '').
+"""
+
+import math
+import mmap
+import os
+import struct
+from datetime import datetime
+from pathlib import Path
+
+from .utils import parse_timestamp
+
+RING_MAGIC = b'GPUR'
+RING_VERSION = 1
+
+# magic, version, slots, head
+HEADER = struct.Struct('<4sIIQ')
+HEADER_SIZE = 64
+HEAD_OFFSET = 12
+
+# timestamp (ms since epoch), gpu_id, utilization (%), memory used/total (MiB),
+# temperature (C), power (centiwatts), process string index. The DCGM-only
+# CSV columns (sm_active ... pcie_tx_bytes) are not stored
+ROW = struct.Struct('<QBBIIBII')
+
+# 24h of 8 GPUs at 1 Hz
+DEFAULT_RING_SLOTS = 8 * 86400
+
+
+def _procs_path(path):
+    return Path(str(path) + '.procs')
+
+
+U8_MAX = 0xFF
+U32_MAX = 0xFFFFFFFF
+
+
+def _to_int(value, scale=1, limit=U32_MAX):
+    """Packable field value: blank or non-numeric readings ('[N/A]') are 0,
+    out-of-range ones are clamped to 0..limit."""
+    try:
+        number = float(value) * scale
+    except (TypeError, ValueError):
+        return 0
+    if not math.isfinite(number):
+        return 0
+    return min(max(int(round(number)), 0), limit)
+
+
+class RingLogWriter:
+    """Appends sample rows to a memory-mapped ring buffer file."""
+
+    def __init__(self, path, slots=DEFAULT_RING_SLOTS):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        size = HEADER_SIZE + slots * ROW.size
+
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if os.fstat(fd).st_size == 0:
+                try:
+                    os.posix_fallocate(fd, 0, size)
+                except (AttributeError, OSError):
+                    os.ftruncate(fd, size)
+                os.pwrite(fd, HEADER.pack(RING_MAGIC, RING_VERSION, slots, 0), 0)
+            self._mm = mmap.mmap(fd, 0)
+        finally:
+            os.close(fd)
+
+        magic, version, self.slots, self.head = HEADER.unpack_from(self._mm, 0)
+        if magic != RING_MAGIC or version != RING_VERSION:
+            self._mm.close()
+            raise ValueError(f"Not a GPU ring log: {self.path}")
+
+        # Existing strings keep their indices when appending to a ring
+        self._procs_file = open(_procs_path(self.path), 'a+')
+        self._procs_file.seek(0)
+        names = self._procs_file.read().split('\n')[:-1]
+        if not names:
+            self._procs_file.write('\n')
+            self._procs_file.flush()
+            names = ['']
+        self._proc_ids = {name: i for i, name in enumerate(names)}
+
+    def _proc_id(self, name):
+        proc_id = self._proc_ids.get(name)
+        if proc_id is None:
+            proc_id = len(self._proc_ids)
+            self._proc_ids[name] = proc_id
+            self._procs_file.write(name.replace('\n', ' ') + '\n')
+            self._procs_file.flush()
+        return proc_id
+
+    def append(self, rows):
+        """Write row tuples (as produced by GPULogger) into the next slots."""
+        mm = self._mm
+        ts_cache = {}
+        for row in rows:
+            ts_str = row[0]
+            ts_ms = ts_cache.get(ts_str)
+            if ts_ms is None:
+                ts = parse_timestamp(ts_str)
+                ts_ms = int(ts.timestamp() * 1000) if ts else 0
+                ts_cache[ts_str] = ts_ms
+            ROW.pack_into(
+                mm, HEADER_SIZE + (self.head % self.slots) * ROW.size,
+                ts_ms,
+                _to_int(row[1], limit=U8_MAX),   # gpu_id
+                _to_int(row[2], limit=U8_MAX),   # utilization_gpu
+                _to_int(row[3]),                 # memory_used
+                _to_int(row[4]),                 # memory_total
+                _to_int(row[5], limit=U8_MAX),   # temperature
+                _to_int(row[6], 100),            # power_draw
+                self._proc_id(row[7]),           # process_info
+            )
+            self.head += 1
+        # Publish the new head only after the rows it covers are written
+        struct.pack_into('<Q', mm, HEAD_OFFSET, self.head)
+
+    def close(self):
+        self._mm.flush()
+        self._mm.close()
+        self._procs_file.close()
+
+
+def get_ring_head(log_path):
+    """Return the total number of rows ever written to a ring log."""
+    with open(log_path, 'rb') as f:
+        magic, version, slots, head = HEADER.unpack(f.read(HEADER.size))
+    if magic != RING_MAGIC:
+        raise ValueError(f"Not a GPU ring log: {log_path}")
+    return head
+
+
+def read_ring_log(log_path, since=0):
+    """Read rows written after row number `since` from a ring log.
+
+    Returns (rows, head) with rows in the same dict format as parse_log_file,
+    oldest first. Rows already overwritten by the writer are skipped.
+    """
+    with open(log_path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            magic, version, slots, head = HEADER.unpack_from(mm, 0)
+            if magic != RING_MAGIC:
+                raise ValueError(f"Not a GPU ring log: {log_path}")
+            start = max(since, head - slots)
+            records = [ROW.unpack_from(mm, HEADER_SIZE + (n % slots) * ROW.size)
+                       for n in range(start, head)]
+
+    try:
+        names = _procs_path(log_path).read_text().split('\n')
+    except FileNotFoundError:
+        names = ['']
+
+    rows = []
+    last_ms = None
+    for ts_ms, gpu_id, util, mem_used, mem_total, temp, power_cw, proc_id in records:
+        if ts_ms != last_ms:
+            ts = datetime.fromtimestamp(ts_ms / 1000)
+            ts_str = ts.strftime('%Y/%m/%d %H:%M:%S.%f')[:-3]
+            last_ms = ts_ms
+        rows.append({
+            'timestamp': ts_str,
+            '_ts': ts,
+            'gpu_id': gpu_id,
+            'utilization_gpu': float(util),
+            'memory_used': float(mem_used),
+            'memory_total': float(mem_total),
+            'temperature': float(temp),
+            'power_draw': power_cw / 100,
+            'process_info': names[proc_id] if proc_id < len(names) else ''
+        })
+    return rows, head
@@ -1,7 +1,17 @@
+import contextlib
 import csv
+import io
+import os
+import warnings
 from pathlib import Path
 from datetime import datetime
 
+import numpy as np
+
+# Columns every CSV log has, in the order parse_log_file reads them
+LOG_COLUMNS = ('timestamp', 'gpu_id', 'utilization_gpu', 'memory_used',
+               'memory_total', 'temperature', 'power_draw')
+
 
 def find_logs(logs_dir=None):
     """Find all GPU log files in the logs directory."""
@@ -10,74 +20,155 @@ def find_logs(logs_dir=None):
     else:
         logs_dir = Path(logs_dir)
 
-    if not logs_dir.exists():
+    # Find all CSV and ring logs matching the pattern. DirEntry caches its
+    # stat, so each file is stat'ed once for the sort
+    try:
+        with os.scandir(logs_dir) as it:
+            entries = [entry for entry in it
+                       if entry.name.startswith('gpu_')
+                       and entry.name.endswith(('.csv', '.ring'))
+                       and entry.is_file()]
+    except FileNotFoundError:
         return []
-
-    # Find all CSV files matching the pattern
-    log_files = sorted(logs_dir.glob('gpu_*.csv'), key=lambda p: p.stat().st_mtime)
-    return log_files
+    entries.sort(key=lambda entry: entry.stat().st_mtime)
+    return [Path(entry.path) for entry in entries]
 
 
 def get_latest_log(logs_dir=None):
-    """Get the most recently modified log file."""
+    """Get the most recently modified log file.
+
+    Not cached: appending to a log changes its mtime but not the
+    directory's, and find_logs is a single scandir pass anyway.
+    """
     logs = find_logs(logs_dir)
     return logs[-1] if logs else None
 
 
+def read_log_snapshot(log_path):
+    """Read a CSV log into memory up to its last complete line.
+
+    Returns (buffer, bytes consumed). A logger may be appending while we
+    read, so parsing one snapshot keeps every pass over it the same length,
+    and the byte count is where reads of later rows should start.
+    """
+    with open(log_path, 'rb') as f:
+        raw = f.read()
+    end = raw.rfind(b'\n') + 1
+    return io.StringIO(raw[:end].decode(), newline=''), end
+
+
+def _open_log(source):
+    """Open a log path for csv, or rewind a buffer from read_log_snapshot."""
+    if isinstance(source, io.StringIO):
+        source.seek(0)
+        return contextlib.nullcontext(source)
+    return open(source, 'r', newline='')
+
+
 def parse_log_file(log_path):
     """Parse a GPU log CSV file into structured data.
 
+    log_path may also be a buffer from read_log_snapshot.
     Returns a list of dicts with parsed data.
     """
-    log_path = Path(log_path)
-
-    if not log_path.exists():
-        raise FileNotFoundError(f"Log file not found: {log_path}")
-
     data = []
 
-    with open(log_path, 'r') as f:
-        reader = csv.DictReader(f)
+    with _open_log(log_path) as f:
+        # csv.reader plus column indices from the header: DictReader would
+        # build a throwaway dict per row before the parsed one
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return data
+        try:
+            (ts_col, id_col, util_col, used_col, total_col,
+             temp_col, power_col) = [header.index(name) for name in LOG_COLUMNS]
+        except ValueError:
+            return data
+        # Backward compatible: older logs have no process_info column
+        proc_col = header.index('process_info') if 'process_info' in header else None
+
         for row in reader:
             try:
-                ts = parse_timestamp(row['timestamp'])
+                ts = parse_timestamp(row[ts_col])
                 if ts is None:
                     continue
                 # Convert numeric values
                 parsed_row = {
-                    'timestamp': row['timestamp'],
+                    'timestamp': row[ts_col],
                     '_ts': ts,
-                    'gpu_id': int(row['gpu_id']),
-                    'utilization_gpu': float(row['utilization_gpu']),
-                    'memory_used': float(row['memory_used']),
-                    'memory_total': float(row['memory_total']),
-                    'temperature': float(row['temperature']),
-                    'power_draw': float(row['power_draw']) if row['power_draw'] else 0.0,
-                    'process_info': row.get('process_info', '')  # Backward compatible
+                    'gpu_id': int(row[id_col]),
+                    'utilization_gpu': float(row[util_col]),
+                    'memory_used': float(row[used_col]),
+                    'memory_total': float(row[total_col]),
+                    'temperature': float(row[temp_col]),
+                    'power_draw': float(row[power_col]) if row[power_col] else 0.0,
+                    'process_info': row[proc_col] if proc_col is not None and proc_col < len(row) else ''
                 }
                 data.append(parsed_row)
-            except (ValueError, KeyError) as e:
+            except (ValueError, IndexError):
                 # Skip malformed rows
                 continue
 
     return data
 
 
+def parse_log_columns(log_path):
+    """Parse a whole CSV log straight into NumPy columns.
+
+    log_path may also be a buffer from read_log_snapshot. Returns
+    {field: array} with the '_ts', metric and 'process_info' fields (no
+    'timestamp' strings), or None if some row needs parse_log_file's
+    row-by-row handling: malformed rows or other timestamp formats.
+    """
+    with _open_log(log_path) as f:
+        header = next(csv.reader(f), None)
+    if header is None:
+        return None
+    try:
+        cols = [header.index(name) for name in LOG_COLUMNS]
+    except ValueError:
+        return None
+    proc_col = header.index('process_info') if 'process_info' in header else None
+    text_cols = (cols[0],) if proc_col is None else (cols[0], proc_col)
+
+    # loadtxt parses in C; power is blank for GPUs that do not report it
+    options = dict(delimiter=',', skiprows=1, quotechar='"', comments=None, ndmin=2)
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')  # e.g. loadtxt on a header-only log
+            with _open_log(log_path) as f:
+                numbers = np.loadtxt(f, usecols=cols[1:], **options,
+                                     converters={cols[-1]: lambda s: float(s) if s else 0.0})
+            with _open_log(log_path) as f:
+                text = np.loadtxt(f, usecols=text_cols, dtype=str, **options)
+            ts = np.char.replace(text[:, 0], '/', '-').astype('datetime64[us]')
+    except ValueError:
+        return None
+    if np.isnat(ts).any():
+        return None
+
+    columns = {'_ts': ts}
+    columns.update(zip(LOG_COLUMNS[1:], numbers.T))
+    if proc_col is None:
+        columns['process_info'] = np.full(len(ts), '', dtype=object)
+    else:
+        columns['process_info'] = text[:, 1].astype(object)
+    return columns
+
+
 def parse_log_file_incremental(log_path, file_pos):
     """Read new rows appended to a log file since file_pos.
 
     Returns (new_data, new_file_pos).
     """
-    log_path = Path(log_path)
     new_data = []
 
-    with open(log_path, 'r') as f:
+    with open(log_path, 'r', newline='') as f:
         f.seek(file_pos)
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            parts = line.split(',', 7)  # 8 fields max
+        # csv.reader so quoted process_info and trailing columns
+        # (e.g. DCGM fields) split correctly
+        for parts in csv.reader(f):
             if len(parts) < 7:
                 continue
             try:
@@ -116,6 +207,13 @@ def format_timestamp(ts_str):
 
 def parse_timestamp(ts_str):
     """Parse timestamp string to datetime object."""
+    if len(ts_str) == 23:
+        # The logger's own 'YYYY/MM/DD HH:MM:SS.mmm' is ISO 8601 once the
+        # slashes are dashes, and fromisoformat is much faster than strptime
+        try:
+            return datetime.fromisoformat(ts_str.replace('/', '-'))
+        except ValueError:
+            pass
     try:
         return datetime.strptime(ts_str, '%Y/%m/%d %H:%M:%S.%f')
     except ValueError:
@@ -2,17 +2,23 @@ from textual.app import App, ComposeResult
 from textual.widgets import Header, Footer, Static, Label
 from textual.containers import Container, Vertical, Horizontal, Grid, VerticalScroll
 from textual import events, work
+from textual.worker import get_current_worker
 from textual.reactive import reactive
 from rich.text import Text
 from rich.style import Style
 import os
 import time
-from bisect import bisect_left, bisect_right
 from datetime import datetime, timedelta
 from pathlib import Path
 
-from .utils import parse_log_file, parse_log_file_incremental, format_timestamp, parse_timestamp
-from .plotter import create_plot
+import numpy as np
+
+from .history import SampleHistory
+from .ringbuffer import RingBuffer
+from .utils import (parse_log_columns, parse_log_file, parse_log_file_incremental,
+                    read_log_snapshot, format_timestamp, parse_timestamp)
+from .ringlog import read_ring_log
+from .plotter import create_plot, create_progress_bar, format_hms
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # GRUVBOX DARK THEME - 256 COLOR PALETTE (tmux compatible)
@@ -39,42 +45,70 @@ GRV_PURPLE = "color(175)"   # #d3869b
 GRV_AQUA = "color(108)"     # #8ec07c
 GRV_ORANGE = "color(208)"   # #fe8019
 
+# Styles used on every render, parsed once: a style string is looked up
+# again by Rich for every span that carries it
+BOLD_FG = Style.parse(f"bold {GRV_FG}")
+BOLD_AQUA = Style.parse(f"bold {GRV_AQUA}")
+ITALIC_FG4 = Style.parse(f"italic {GRV_FG4}")
+FG4_STYLE = Style.parse(GRV_FG4)
+BG3_STYLE = Style.parse(GRV_BG3)
+BG4_STYLE = Style.parse(GRV_BG4)
+BLUE_STYLE = Style.parse(GRV_BLUE)
+ORANGE_STYLE = Style.parse(GRV_ORANGE)
+PURPLE_STYLE = Style.parse(GRV_PURPLE)
+# Plain and bold styles of the green/yellow/red level colors
+COLOR_STYLES = {color: Style.parse(color) for color in (GRV_GREEN, GRV_YELLOW, GRV_RED)}
+BOLD_LEVEL = {color: Style.parse(f"bold {color}") for color in (GRV_GREEN, GRV_YELLOW, GRV_RED)}
+
+# Sparkline characters, lowest to highest, as UTF-32 code units
+SPARKLINE_CODES = np.array([ord(c) for c in '▁▂▃▄▅▆▇█'], dtype='<u4')
+
 
 class Sparkline(Static):
     """A compact sparkline chart widget."""
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.values = []
+        self.values = RingBuffer(60)  # Keep last 60 points
         self.color = GRV_AQUA
+        self._chars = ""  # Rendered block characters, rebuilt on update
 
     def update_values(self, values, color=None):
         """Update sparkline with new values. Uses Gruvbox aqua by default."""
         if color is None:
             color = GRV_AQUA
-        self.values = values[-60:] if len(values) > 60 else values  # Keep last 60 points
+        values = np.asarray(values)[-self.values.capacity:]
+        if color == self.color and np.array_equal(values, self.values.view()):
+            return  # Nothing new to draw
+        self.values.clear()
+        self.values.extend(values)
         self.color = color
+        self._chars = self._spark_chars()
         self.refresh()
 
-    def render(self) -> Text:
-        """Render sparkline using block characters."""
-        if not self.values:
-            return Text("" * 30, style=GRV_FG4)
-
-        # Sparkline characters
-        chars = ['▁', '▂', '▃', '▄', '▅', '▆', '▇', '█']
-
-        max_val = max(self.values) if self.values else 1
-        min_val = min(self.values) if self.values else 0
+    def _spark_chars(self):
+        """Map the stored values to block characters, scaled to their range."""
+        values = self.values.view()
+        if len(values) == 0:
+            return ""
+        max_val = values.max()
+        min_val = values.min()
         range_val = max_val - min_val if max_val != min_val else 1
 
-        sparkline = []
-        for val in self.values:
-            normalized = (val - min_val) / range_val if range_val > 0 else 0
-            idx = min(int(normalized * len(chars)), len(chars) - 1)
-            sparkline.append(chars[idx])
+        # Bucket every value into one of the block characters at once
+        idx = np.minimum(((values - min_val) / range_val * len(SPARKLINE_CODES)).astype(np.intp),
+                         len(SPARKLINE_CODES) - 1)
+        return SPARKLINE_CODES[idx].tobytes().decode('utf-32-le')
 
-        return Text(''.join(sparkline), style=self.color)
+    def render(self) -> Text:
+        """Render sparkline using block characters."""
+        if not self._chars:
+            return Text("" * 30, style=FG4_STYLE)
+        return Text(self._chars, style=self.color)
+
+# Every possible MetricBar bar string, indexed by filled cell count
+METRIC_BAR_WIDTH = 30
+METRIC_BARS = tuple('█' * i + '░' * (METRIC_BAR_WIDTH - i) for i in range(METRIC_BAR_WIDTH + 1))
 
 
 class MetricBar(Static):
@@ -86,18 +120,25 @@ class MetricBar(Static):
         self.unit = unit
         self.value = 0
         self.max_value = 100
+        self._text = self._bar_text()  # Rebuilt only when the value changes
 
     def update_value(self, value, max_value=100):
         """Update bar value."""
+        if value == self.value and max_value == self.max_value:
+            return
         self.value = value
         self.max_value = max_value
+        self._text = self._bar_text()
         self.refresh()
 
     def render(self) -> Text:
         """Render progress bar with colors."""
-        width = 30
+        return self._text
+
+    def _bar_text(self):
+        """Build the label, bar and value text for the current value."""
         percentage = (self.value / self.max_value) if self.max_value > 0 else 0
-        filled = int(width * percentage)
+        filled = min(max(int(METRIC_BAR_WIDTH * percentage), 0), METRIC_BAR_WIDTH)
 
         # Color based on percentage - Gruvbox colors
         if percentage < 0.5:
@@ -107,8 +148,7 @@ class MetricBar(Static):
         else:
             color = GRV_RED
 
-        # Create bar
-        bar = '█' * filled + '░' * (width - filled)
+        bar = METRIC_BARS[filled]
 
         # Format value display
         if self.unit == "%":
@@ -123,12 +163,29 @@ class MetricBar(Static):
             value_str = f"{self.value:.1f}{self.unit}"
 
         text = Text()
-        text.append(f"{self.label:8s} ", style=f"bold {GRV_AQUA}")
-        text.append(bar, style=color)
-        text.append(f" {value_str}", style=f"bold {color}")
+        text.append(f"{self.label:8s} ", style=BOLD_AQUA)
+        text.append(bar, style=COLOR_STYLES[color])
+        text.append(f" {value_str}", style=BOLD_LEVEL[color])
 
         return text
 
+# Card status label for each utilization level color
+STATUS_TEXT = {GRV_GREEN: "IDLE", GRV_YELLOW: "ACTIVE", GRV_RED: "HIGH"}
+
+
+def _level_color(value, mid, high):
+    """Gruvbox color for a reading: green up to mid, yellow up to high, red above."""
+    if value > high:
+        return GRV_RED
+    if value > mid:
+        return GRV_YELLOW
+    return GRV_GREEN
+
+
+# Sample fields shown in a GPUCard header
+HEADER_FIELDS = ('utilization_gpu', 'memory_used', 'memory_total', 'temperature',
+                 'power_draw', 'process_info')
+
 
 class GPUCard(Static):
     """A beautiful card displaying metrics for a single GPU."""
@@ -137,63 +194,134 @@ class GPUCard(Static):
         super().__init__(*args, **kwargs)
         self.gpu_id = gpu_id
         self.metrics = None
-        self.history = []
+        self._plots = None
+        self._plots_key = None  # Cheap fingerprint of the history behind _plots
+        self._header = None  # Text parts of the header for the current metrics
+        self._header_key = None  # The HEADER_FIELDS values behind _header
         self.show_gpu = show_gpu
         self.show_mem = show_mem
         self.show_temp = show_temp
         self.show_power = show_power
+        # History columns the plots draw from, so only these are copied out
+        shown = (show_gpu, show_mem, show_temp, show_power)
+        metrics = ('utilization_gpu', 'memory_used', 'temperature', 'power_draw')
+        self.plot_fields = ('_ts', 'process_info') + tuple(
+            name for name, show in zip(metrics, shown) if show)
 
     def update_metrics(self, metrics, history):
-        """Update GPU card with latest metrics."""
+        """Update GPU card with latest metrics.
+
+        history maps each of plot_fields to this GPU's samples in the view.
+        """
+        # An idle GPU often reports the same readings tick after tick; the
+        # header only needs redrawing when one of them changed (every sample
+        # has a new timestamp, so the whole row cannot be compared)
+        shown = tuple(metrics.get(name) for name in HEADER_FIELDS)
+        if shown != self._header_key:
+            self._header_key = shown
+            self._header = self._header_parts(metrics)
+            self.refresh()
         self.metrics = metrics
-        self.history = history
-        self.refresh()
 
-    def render(self) -> Text:
-        """Render the GPU card content with beautiful styling."""
-        from .plotter import create_progress_bar, create_sparkline
+        # The history is a time-ordered slice of one GPU's samples, so its
+        # length, end timestamps and newest row identify it well enough to
+        # skip re-plotting an unchanged window
+        timestamps = history['_ts']
+        key = (len(timestamps), timestamps[0], timestamps[-1], tuple(metrics.values()))
+        if key != self._plots_key:
+            self._plots_key = key
+            self._render_plots(history)
+
+    @work(thread=True, exclusive=True)
+    def _render_plots(self, history):
+        """Rasterize the history plots off the UI thread.
+
+        The card keeps showing the previous frame until this one is ready;
+        a newer update cancels a render that has not been delivered yet.
+        """
+        timestamps = history['_ts']
+        # Plots are labelled with the latest process only, so pass just that
+        # name rather than a list (hashed into the plot cache key) per sample
+        procs = history['process_info']
+        named = np.flatnonzero(procs != '')
+        process_names = [procs[named[-1]]] if len(named) else None
 
         text = Text()
+        text.append(" ───────────────────────────────────────────────\n", style=BG3_STYLE)
+
+        if self.show_gpu:
+            util_values = history['utilization_gpu']
+            plot_text = create_plot(util_values, timestamps, "util", "GPU", "%",
+                                   width=50, height=5, process_names=process_names)
+            text.append_text(plot_text)
+
+        if self.show_mem:
+            mem_values = history['memory_used'] / 1024
+            plot_text = create_plot(mem_values, timestamps, "mem", "MEM", "GB",
+                                   width=50, height=5, process_names=process_names)
+            text.append_text(plot_text)
+
+        if self.show_temp:
+            temp_values = history['temperature']
+            plot_text = create_plot(temp_values, timestamps, "temp", "TMP", "°C",
+                                   width=50, height=5, process_names=process_names)
+            text.append_text(plot_text)
+
+        if self.show_power:
+            power_values = history['power_draw']
+            plot_text = create_plot(power_values, timestamps, "power", "PWR", "W",
+                                   width=50, height=5, process_names=process_names)
+            text.append_text(plot_text)
+
+        if not get_current_worker().is_cancelled:
+            self.app.call_from_thread(self._on_plots_rendered, text)
+
+    def _on_plots_rendered(self, plots):
+        """Called on the main thread with a finished plot frame."""
+        self._plots = plots
+        self.refresh()
 
+    def render(self) -> Text:
+        """Render the GPU card content with beautiful styling."""
         if not self.metrics:
-            text.append(f"  GPU {self.gpu_id}", style=f"bold {GRV_AQUA}")
-            text.append(" │ ", style=GRV_BG4)
-            text.append("Waiting for data...", style=f"italic {GRV_FG4}")
-            return text
+            return Text.assemble(
+                (f"  GPU {self.gpu_id}", BOLD_AQUA),
+                (" │ ", BG4_STYLE),
+                ("Waiting for data...", ITALIC_FG4),
+            )
+
+        # ═══════════════════════════════════════════════════════════
+        # GRAPH: High-resolution Braille plot (last frame from _render_plots)
+        # ═══════════════════════════════════════════════════════════
+        if self._plots is not None:
+            return Text.assemble(*self._header, self._plots)
+        return Text.assemble(*self._header)
 
-        metrics = self.metrics
+    def _header_parts(self, metrics):
+        """Build the status and metric bar lines as Text.assemble parts.
 
+        Done once per change of readings rather than on every render.
+        """
         # ═══════════════════════════════════════════════════════════
         # HEADER: GPU ID + Status
         # ═══════════════════════════════════════════════════════════
         util = metrics['utilization_gpu']
-
-        # Status indicator with icon (Gruvbox colors)
-        if util > 80:
-            status_icon = "●"
-            status_color = GRV_RED
-            status_text = "HIGH"
-        elif util > 30:
-            status_icon = "●"
-            status_color = GRV_YELLOW
-            status_text = "ACTIVE"
-        else:
-            status_icon = "●"
-            status_color = GRV_GREEN
-            status_text = "IDLE"
-
-        text.append(f" GPU {self.gpu_id}", style=f"bold {GRV_FG}")
-        text.append(" │ ", style=GRV_BG4)
-        text.append(f"{status_icon} ", style=f"bold {status_color}")
-        text.append(f"{status_text}", style=status_color)
-        text.append("\n")
+        util_color = _level_color(util, 30, 80)
+
+        # Status indicator with icon (Gruvbox colors). The header is
+        # collected as (text, style) parts for render's Text.assemble
+        parts = [
+            (f" GPU {self.gpu_id}", BOLD_FG),
+            (" │ ", BG4_STYLE),
+            ("● ", BOLD_LEVEL[util_color]),
+            (STATUS_TEXT[util_color], COLOR_STYLES[util_color]),
+            "\n",
+        ]
 
         # Process info on its own row
         process_info = metrics.get('process_info', '')
         if process_info:
-            text.append(" ⚙ ", style=GRV_FG4)
-            text.append(f"{process_info}", style=GRV_PURPLE)
-            text.append("\n")
+            parts += [(" ⚙ ", FG4_STYLE), (f"{process_info}", PURPLE_STYLE), "\n"]
 
         # ═══════════════════════════════════════════════════════════
         # METRICS BAR: Compact view of all metrics with progress bars
@@ -202,70 +330,50 @@ class GPUCard(Static):
         mem_total = metrics['memory_total'] / 1024
         temp = metrics['temperature']
         power = metrics['power_draw']
-
-        # GPU and Memory on same line (smaller bars) - Gruvbox colors
-        text.append(" GPU ", style=GRV_FG4)
-        text.append_text(create_progress_bar(util, 100, width=8, show_percent=False))
-        util_color = GRV_RED if util > 80 else (GRV_YELLOW if util > 30 else GRV_GREEN)
-        text.append(f"{util:4.0f}%", style=f"bold {util_color}")
-
-        text.append(" │ ", style=GRV_BG4)
-        text.append("MEM ", style=GRV_FG4)
         mem_pct = (mem_used / mem_total * 100) if mem_total > 0 else 0
-        text.append_text(create_progress_bar(mem_used, mem_total, width=8, show_percent=False))
-        mem_color = GRV_RED if mem_pct > 80 else (GRV_YELLOW if mem_pct > 60 else GRV_GREEN)
-        text.append(f"{mem_used:4.0f}G", style=f"bold {mem_color}")
-
-        text.append("\n")
-
-        # Temperature and Power on second line (smaller bars) - Gruvbox colors
-        text.append(" TMP ", style=GRV_FG4)
-        text.append_text(create_progress_bar(temp, 100, width=8, show_percent=False))
-        temp_color = GRV_RED if temp > 80 else (GRV_YELLOW if temp > 65 else GRV_GREEN)
-        text.append(f"{temp:4.0f}°", style=f"bold {temp_color}")
-
-        text.append(" │ ", style=GRV_BG4)
-        text.append("PWR ", style=GRV_FG4)
-        text.append_text(create_progress_bar(power, 400, width=8, show_percent=False))
-        power_color = GRV_RED if power > 300 else (GRV_YELLOW if power > 200 else GRV_GREEN)
-        text.append(f"{power:4.0f}W", style=f"bold {power_color}")
-
-        text.append("\n")
-
-        # ═══════════════════════════════════════════════════════════
-        # GRAPH: High-resolution Braille plot
-        # ═══════════════════════════════════════════════════════════
-        if self.history:
-            timestamps = [p['_ts'] for p in self.history]
-            process_names = [p.get('process_info', '') for p in self.history]
-
-            text.append(" ───────────────────────────────────────────────\n", style=GRV_BG3)
-
-            if self.show_gpu:
-                util_values = [p['utilization_gpu'] for p in self.history]
-                plot_text = create_plot(util_values, timestamps, "util", "GPU", "%",
-                                       width=50, height=5, process_names=process_names)
-                text.append_text(plot_text)
-
-            if self.show_mem:
-                mem_values = [p['memory_used'] / 1024 for p in self.history]
-                plot_text = create_plot(mem_values, timestamps, "mem", "MEM", "GB",
-                                       width=50, height=5, process_names=process_names)
-                text.append_text(plot_text)
-
-            if self.show_temp:
-                temp_values = [p['temperature'] for p in self.history]
-                plot_text = create_plot(temp_values, timestamps, "temp", "TMP", "°C",
-                                       width=50, height=5, process_names=process_names)
-                text.append_text(plot_text)
-
-            if self.show_power:
-                power_values = [p['power_draw'] for p in self.history]
-                plot_text = create_plot(power_values, timestamps, "power", "PWR", "W",
-                                       width=50, height=5, process_names=process_names)
-                text.append_text(plot_text)
 
-        return text
+        parts += [
+            # GPU and Memory on same line (smaller bars) - Gruvbox colors
+            (" GPU ", FG4_STYLE),
+            create_progress_bar(util, 100, width=8, show_percent=False),
+            (f"{util:4.0f}%", BOLD_LEVEL[util_color]),
+            (" │ ", BG4_STYLE),
+            ("MEM ", FG4_STYLE),
+            create_progress_bar(mem_used, mem_total, width=8, show_percent=False),
+            (f"{mem_used:4.0f}G", BOLD_LEVEL[_level_color(mem_pct, 60, 80)]),
+            "\n",
+            # Temperature and Power on second line (smaller bars) - Gruvbox colors
+            (" TMP ", FG4_STYLE),
+            create_progress_bar(temp, 100, width=8, show_percent=False),
+            (f"{temp:4.0f}°", BOLD_LEVEL[_level_color(temp, 65, 80)]),
+            (" │ ", BG4_STYLE),
+            ("PWR ", FG4_STYLE),
+            create_progress_bar(power, 400, width=8, show_percent=False),
+            (f"{power:4.0f}W", BOLD_LEVEL[_level_color(power, 200, 300)]),
+            "\n",
+        ]
+        return parts
+
+
+# Samples a live view keeps in memory (about 40 bytes each); older ones are
+# dropped as new ones arrive. At 1 Hz that is over a day of history for 8 GPUs
+LIVE_HISTORY_SAMPLES = 1_000_000
+
+# Fixed pieces of the title and controls bars, built once and copied into
+# each update alongside the changing values
+TITLE_SEP = Text("  │  ", style=BG3_STYLE)
+TITLE_PREFIX = Text.assemble(
+    ("  ◈ ", BOLD_LEVEL[GRV_YELLOW]),
+    ("GPU Monitor", BOLD_FG),
+    TITLE_SEP,
+)
+TITLE_LIVE = Text.assemble(TITLE_SEP, ("● ", BOLD_LEVEL[GRV_RED]), ("LIVE", COLOR_STYLES[GRV_RED]))
+MODE_TEXT = {
+    'paused': Text.assemble(("▐▐ ", COLOR_STYLES[GRV_RED]), ("PAUSED", COLOR_STYLES[GRV_RED])),
+    'live': Text.assemble(("● ", COLOR_STYLES[GRV_GREEN]), ("LIVE", COLOR_STYLES[GRV_GREEN])),
+    'history': Text.assemble(("◆ ", ORANGE_STYLE), ("HISTORY", ORANGE_STYLE)),
+    'static': Text.assemble(("◼ ", BLUE_STYLE), ("STATIC", BLUE_STYLE)),
+}
 
 
 class GPUMonitorApp(App):
@@ -377,19 +485,32 @@ class GPUMonitorApp(App):
         self.show_mem = show_mem
         self.show_temp = show_temp
         self.show_power = show_power
-        self.all_data = []
-        self._timestamps = []  # Parallel list of datetime objects for bisect
-        self._file_pos = 0  # Track file position for incremental reads
+        # Live views keep a bounded history; a static view shows the whole log
+        self._history_capacity = LIVE_HISTORY_SAMPLES if live_mode else None
+        self.all_data = SampleHistory(capacity=self._history_capacity)  # Columnar, time-ordered samples
+        self._file_pos = 0  # Track file position (ring logs: rows read) for incremental reads
+        self._file_ino = None  # Inode of the CSV log, to notice it being replaced
+        self._ring_log = self.log_file.suffix == '.ring'
         self.view_start = None
         self.view_end = None
         self.default_window = 300  # 5 minutes
         self.last_update = 0
         self.update_interval = 1.0
         self.gpu_ids = []
+        self._gpu_id_set = set()  # gpu_ids as a set, grown as rows arrive
         # following = True means view auto-scrolls with new data
         # following = False means view stays fixed (user panned away from "now")
         self.following = True
         self._scroll_container = None  # Cached for fast scrolling
+        self._title_bar = None
+        self._controls = None
+        self._controls_view = None  # (view_start, view_end) behind _controls_range
+        self._controls_range = None  # Time range part of the controls bar
+        self._controls_key = None  # Inputs of the controls bar last shown
+        self._cards = {}  # gpu_id -> GPUCard
+        self._last_render_key = None  # Inputs of the last update_plots
+        self._plot_update_pending = False  # A coalesced update_plots is queued
+        self._reading = True  # The initial load or a live read is in flight
 
     def compose(self) -> ComposeResult:
         """Compose the UI."""
@@ -409,8 +530,11 @@ class GPUMonitorApp(App):
         """Initialize when app is mounted."""
         self.title = "GPU Monitor"
 
-        # Cache scroll container for fast scrolling
+        # Cache scroll container for fast scrolling, and the widgets
+        # updated on every tick
         self._scroll_container = self.query_one("#main-container", VerticalScroll)
+        self._title_bar = self.query_one("#title-bar", Static)
+        self._controls = self.query_one("#controls", Static)
 
         self.update_title()
         self.update_grid_columns()
@@ -424,29 +548,51 @@ class GPUMonitorApp(App):
     @work(thread=True)
     def _start_async_load(self) -> None:
         """Load data in a background thread to avoid blocking the UI."""
+        data, file_pos = self.load_data()
+        self.call_from_thread(self._on_data_loaded, data, file_pos)
+
+    def load_data(self):
+        """Read the whole log file.
+
+        Returns (SampleHistory, position to read new rows from). Runs in
+        worker threads, so it leaves the app's state alone.
+        """
+        if self._ring_log:
+            try:
+                rows, file_pos = read_ring_log(self.log_file)
+            except Exception:
+                rows, file_pos = [], 0
+            return SampleHistory(rows, self._history_capacity), file_pos
+
         try:
-            data = parse_log_file(self.log_file)
+            return self._read_csv_history()
         except Exception:
-            data = []
-        file_pos = os.path.getsize(self.log_file) if self.log_file.exists() else 0
-        self.call_from_thread(self._on_data_loaded, data, file_pos)
+            # Unreadable log: show only rows written from now on
+            file_pos = os.path.getsize(self.log_file) if self.log_file.exists() else 0
+            return SampleHistory(capacity=self._history_capacity), file_pos
+
+    def _read_csv_history(self):
+        """Parse the whole CSV log, column-wise unless some row needs the row parser.
+
+        Both parsers run over one snapshot of the file, so rows the logger
+        appends meanwhile are left for the next live read.
+        """
+        data = SampleHistory(capacity=self._history_capacity)
+        snapshot, file_pos = read_log_snapshot(self.log_file)
+        columns = parse_log_columns(snapshot)
+        if columns is not None:
+            data.extend_columns(columns)
+        else:
+            data.extend(parse_log_file(snapshot))
+        return data, file_pos
 
     def _on_data_loaded(self, data, file_pos):
         """Called on the main thread after data loading completes."""
         self.all_data = data
         self._file_pos = file_pos
-        self._build_timestamp_index()
+        self._reading = False  # Live reads may start from file_pos now
 
-        if self.all_data and not self.gpu_ids:
-            self.gpu_ids = sorted(set(point['gpu_id'] for point in self.all_data))
-
-            # Add GPU cards
-            grid = self.query_one("#gpu-grid", Grid)
-            for gpu_id in self.gpu_ids:
-                card = GPUCard(gpu_id, show_gpu=self.show_gpu, show_mem=self.show_mem,
-                              show_temp=self.show_temp, show_power=self.show_power)
-                card.id = f"gpu-card-{gpu_id}"
-                grid.mount(card)
+        self._add_gpus(self.all_data.gpu_ids)
 
         self.reset_view()
         self.update_title()
@@ -455,9 +601,36 @@ class GPUMonitorApp(App):
         # Delay initial update to ensure widgets are fully mounted
         self.set_timer(0.1, self.update_plots)
 
-    def _build_timestamp_index(self):
-        """Build a sorted list of timestamps for binary search."""
-        self._timestamps = [point['_ts'] for point in self.all_data]
+    def _add_gpus(self, gpu_ids):
+        """Track GPU ids seen in newly read rows, mounting cards for new ones."""
+        new_ids = set(gpu_ids) - self._gpu_id_set
+        if not new_ids:
+            return
+        self._gpu_id_set |= new_ids
+        self.gpu_ids = sorted(self._gpu_id_set)
+        self._mount_cards(sorted(new_ids))
+        self.update_title()
+
+    def _mount_cards(self, gpu_ids):
+        """Add a GPU card to the grid for each of gpu_ids, keeping id order."""
+        grid = self.query_one("#gpu-grid", Grid)
+        at_end = []
+        for gpu_id in gpu_ids:
+            card = GPUCard(gpu_id, show_gpu=self.show_gpu, show_mem=self.show_mem,
+                          show_temp=self.show_temp, show_power=self.show_power)
+            card.id = f"gpu-card-{gpu_id}"
+            # Cards are ordered by GPU id; a late GPU goes before the next one
+            after = next((self._cards[g] for g in self.gpu_ids
+                          if g > gpu_id and g in self._cards), None)
+            self._cards[gpu_id] = card
+            if after is not None:
+                grid.mount(card, before=after)
+            else:
+                at_end.append(card)
+        # One mount (and layout pass) for all cards appended to the grid,
+        # e.g. every GPU of the initial load
+        if at_end:
+            grid.mount(*at_end)
 
     def on_resize(self, event) -> None:
         """Handle terminal resize."""
@@ -486,73 +659,98 @@ class GPUMonitorApp(App):
 
     def update_title(self):
         """Update title bar with file info."""
-        title_text = Text()
-
         # Clean, minimal title - Gruvbox colors
-        title_text.append("  ◈ ", style=f"bold {GRV_YELLOW}")
-        title_text.append("GPU Monitor", style=f"bold {GRV_FG}")
-        title_text.append("  │  ", style=GRV_BG3)
-        title_text.append(f"{len(self.gpu_ids)}", style=f"bold {GRV_GREEN}")
-        title_text.append(" GPUs", style=GRV_GREEN)
-        title_text.append("  │  ", style=GRV_BG3)
-        title_text.append(f"{self.log_file.name}", style=GRV_FG4)
-
-        if self.live_mode:
-            title_text.append("  │  ", style=GRV_BG3)
-            title_text.append("● ", style=f"bold {GRV_RED}")
-            title_text.append("LIVE", style=GRV_RED)
-
-        title_bar = self.query_one("#title-bar", Static)
-        title_bar.update(title_text)
+        title_text = Text.assemble(
+            TITLE_PREFIX,
+            (f"{len(self.gpu_ids)}", BOLD_LEVEL[GRV_GREEN]),
+            (" GPUs", COLOR_STYLES[GRV_GREEN]),
+            TITLE_SEP,
+            (f"{self.log_file.name}", FG4_STYLE),
+            TITLE_LIVE if self.live_mode else "",
+        )
 
-    def load_data(self):
-        """Load data from log file."""
-        try:
-            self.all_data = parse_log_file(self.log_file)
-            self._build_timestamp_index()
-        except Exception as e:
-            self.all_data = []
-            self._timestamps = []
+        self._title_bar.update(title_text)
 
     def update_live_data(self):
         """Periodically read new data appended to the log file."""
-        if not self.paused and self.live_mode:
-            # Guard against file truncation/rotation
-            try:
-                current_size = os.path.getsize(self.log_file)
-            except OSError:
-                return
-
-            if current_size < self._file_pos:
-                # File was truncated/rotated, reload from scratch
-                self.load_data()
-                self._file_pos = current_size
+        # The file is read in a worker so a slow disk cannot stall the UI.
+        # Ticks while a read is in flight are skipped: the next read has to
+        # start where that one ends
+        if not self.paused and self.live_mode and not self._reading:
+            self._reading = True
+            self._read_tail()
+
+    @work(thread=True)
+    def _read_tail(self):
+        """Read rows added to the log since the last read."""
+        try:
+            if self._ring_log:
+                result = self._read_ring_tail()
             else:
-                new_data, new_pos = parse_log_file_incremental(self.log_file, self._file_pos)
-                if new_data:
-                    self._file_pos = new_pos
-                    self.all_data.extend(new_data)
-                    self._timestamps.extend(point['_ts'] for point in new_data)
-
-            # Create GPU cards if they don't exist yet (first data arrival)
-            if self.all_data and not self.gpu_ids:
-                self.gpu_ids = sorted(set(point['gpu_id'] for point in self.all_data))
-                grid = self.query_one("#gpu-grid", Grid)
-                for gpu_id in self.gpu_ids:
-                    card = GPUCard(gpu_id, show_gpu=self.show_gpu, show_mem=self.show_mem,
-                                  show_temp=self.show_temp, show_power=self.show_power)
-                    card.id = f"gpu-card-{gpu_id}"
-                    grid.mount(card)
-                self.update_title()
-
-            if self.all_data and self.following:
-                # Only auto-scroll if following (user hasn't panned away)
-                last_ts = self.all_data[-1]['_ts']
-                window_size = self.view_end - self.view_start if self.view_end and self.view_start else timedelta(seconds=self.default_window)
-                self.view_end = last_ts
-                self.view_start = self.view_end - window_size
+                result = self._read_csv_tail()
+        except Exception:
+            result = None
+        self.call_from_thread(self._on_tail_read, result)
+
+    def _on_tail_read(self, result):
+        """Called on the main thread with the outcome of _read_tail.
+
+        result is None when there is nothing new, else (new_rows,
+        reloaded_history, file_pos) with one of the first two set.
+        """
+        self._reading = False
+        if result is not None:
+            new_rows, reloaded, self._file_pos = result
+            if reloaded is not None:
+                self.all_data = reloaded
+            else:
+                self.all_data.extend(new_rows)
+            self._add_gpus(self.all_data.gpu_ids)
+
+        if self.paused:
+            return
+
+        if self.all_data and self.following:
+            # Only auto-scroll if following (user hasn't panned away)
+            last_ts = self.all_data.last_ts
+            window_size = self.view_end - self.view_start if self.view_end and self.view_start else timedelta(seconds=self.default_window)
+            self.view_end = last_ts
+            self.view_start = self.view_end - window_size
+
+        self.update_plots()
+
+    def _read_ring_tail(self):
+        """Read rows written to a ring log since the last read."""
+        try:
+            new_data, head = read_ring_log(self.log_file, self._file_pos)
+        except (OSError, ValueError):
+            return None
+
+        if head < self._file_pos:
+            # Ring was recreated, reload from scratch
+            return (None, *self.load_data())
+        if not new_data:
+            return None
+        return new_data, None, head
+
+    def _read_csv_tail(self):
+        """Read rows appended to a CSV log since the last read."""
+        # Guard against file truncation/rotation
+        try:
+            st = os.stat(self.log_file)
+        except OSError:
+            return None
+
+        replaced = self._file_ino is not None and st.st_ino != self._file_ino
+        self._file_ino = st.st_ino
+        if replaced or st.st_size < self._file_pos:
+            # File was truncated/rotated, reload from scratch
+            return (None, *self.load_data())
 
-            self.update_plots()
+        new_data, new_pos = parse_log_file_incremental(self.log_file, self._file_pos)
+        if not new_data:
+            return None
+        return new_data, None, new_pos
 
     def reset_view(self):
         """Reset view to show last 60 seconds."""
@@ -560,7 +758,7 @@ class GPUMonitorApp(App):
             self.view_start = datetime.now() - timedelta(seconds=self.default_window)
             self.view_end = datetime.now()
         else:
-            last_ts = self.all_data[-1]['_ts']
+            last_ts = self.all_data.last_ts
             self.view_end = last_ts
             self.view_start = self.view_end - timedelta(seconds=self.default_window)
 
@@ -568,71 +766,92 @@ class GPUMonitorApp(App):
         # to avoid updating before widgets are mounted
 
     def get_visible_data(self):
-        """Get data within the current view window using binary search."""
+        """Get the (lo, hi) sample range of the current view window."""
         if not self.all_data or not self.view_start or not self.view_end:
-            return []
-
-        lo = bisect_left(self._timestamps, self.view_start)
-        hi = bisect_right(self._timestamps, self.view_end)
-        return self.all_data[lo:hi]
+            return 0, 0
+        return self.all_data.window(self.view_start, self.view_end)
 
     def update_plots(self):
         """Update all GPU cards with current view data."""
-        visible_data = self.get_visible_data()
-
-        if not visible_data:
+        # Nothing to redraw if neither the window, the data nor the mode
+        # changed (e.g. an idle live tick with no new samples)
+        key = (self.view_start, self.view_end, id(self.all_data), self.all_data.appended,
+               self.paused, self.following)
+        if key == self._last_render_key:
             return
+        self._last_render_key = key
 
-        # Group by GPU ID
-        gpu_data = {}
-        for point in visible_data:
-            gpu_id = point['gpu_id']
-            if gpu_id not in gpu_data:
-                gpu_data[gpu_id] = []
-            gpu_data[gpu_id].append(point)
-
-        # Update each GPU card
-        for gpu_id in self.gpu_ids:
-            data = gpu_data.get(gpu_id, [])
-            if data:
-                try:
-                    card = self.query_one(f"#gpu-card-{gpu_id}")
-                    card.update_metrics(data[-1], data)
-                except Exception as e:
-                    pass
-
-        # Update controls info - clean minimal style
-        window_sec = (self.view_end - self.view_start).total_seconds()
+        lo, hi = self.get_visible_data()
 
-        # Gruvbox themed controls
-        controls_text = Text()
-        controls_text.append("  ", style="")
-        controls_text.append(f"{self.view_start.strftime('%H:%M:%S')}", style=GRV_FG4)
-        controls_text.append(" → ", style=GRV_BG3)
-        controls_text.append(f"{self.view_end.strftime('%H:%M:%S')}", style=GRV_FG4)
-        controls_text.append(f"  {window_sec:.0f}s", style=GRV_BLUE)
+        if hi <= lo:
+            return
 
-        controls_text.append("  │  ", style=GRV_BG3)
+        # Samples of each GPU within the window, as columns. The cards are
+        # repainted together rather than one compositor pass each
+        with self.batch_update():
+            for gpu_id in self.gpu_ids:
+                indices = self.all_data.gpu_rows(gpu_id, lo, hi)
+                if len(indices):
+                    try:
+                        card = self._cards[gpu_id]
+                        card.update_metrics(self.all_data.row(indices[-1]),
+                                            self.all_data.take(indices, card.plot_fields))
+                    except Exception as e:
+                        pass
 
+        # Update controls info - clean minimal style
         if self.paused:
-            controls_text.append("▐▐ ", style=GRV_RED)
-            controls_text.append("PAUSED", style=GRV_RED)
+            mode = 'paused'
         elif self.live_mode and self.following:
-            controls_text.append("● ", style=GRV_GREEN)
-            controls_text.append("LIVE", style=GRV_GREEN)
+            mode = 'live'
         elif self.live_mode and not self.following:
-            controls_text.append("◆ ", style=GRV_ORANGE)
-            controls_text.append("HISTORY", style=GRV_ORANGE)
+            mode = 'history'
         else:
-            controls_text.append("◼ ", style=GRV_BLUE)
-            controls_text.append("STATIC", style=GRV_BLUE)
-
-        controls_text.append("  │  ", style=GRV_BG3)
-        controls_text.append(f"{len(visible_data)} samples", style=GRV_FG4)
+            mode = 'static'
+
+        # Only the parts that changed since the last frame are rebuilt: the
+        # time range part when the view moved, the bar when anything did
+        view = (self.view_start, self.view_end)
+        if view != self._controls_view:
+            self._controls_view = view
+            window_sec = (self.view_end - self.view_start).total_seconds()
+            self._controls_range = Text.assemble(
+                "  ",
+                (format_hms(self.view_start), FG4_STYLE),
+                (" → ", BG3_STYLE),
+                (format_hms(self.view_end), FG4_STYLE),
+                (f"  {window_sec:.0f}s", BLUE_STYLE),
+                TITLE_SEP,
+            )
+        controls_key = (view, mode, hi - lo)
+        if controls_key == self._controls_key:
+            return
+        self._controls_key = controls_key
 
-        controls = self.query_one("#controls", Static)
-        controls.update(controls_text)
-        controls.refresh()
+        # Gruvbox themed controls
+        controls_text = Text.assemble(
+            self._controls_range,
+            MODE_TEXT[mode],
+            TITLE_SEP,
+            (f"{hi - lo} samples", FG4_STYLE),
+        )
+
+        self._controls.update(controls_text)
+        self._controls.refresh()
+
+    def _request_plot_update(self):
+        """Redraw once the pending input is handled.
+
+        Key repeats (e.g. a held arrow key) each move the view, but only the
+        final position is drawn.
+        """
+        if not self._plot_update_pending:
+            self._plot_update_pending = True
+            self.call_after_refresh(self._flush_plot_update)
+
+    def _flush_plot_update(self):
+        self._plot_update_pending = False
+        self.update_plots()
 
     def action_pan_left(self):
         """Pan view left (back in time). Disengages following mode."""
@@ -645,14 +864,14 @@ class GPUMonitorApp(App):
         self.view_start -= shift
         self.view_end -= shift
 
-        first_ts = self.all_data[0]['_ts']
+        first_ts = self.all_data.first_ts
         if self.view_start < first_ts:
             self.view_start = first_ts
             self.view_end = self.view_start + window_size
 
         # Disengage following mode - user is looking at history
         self.following = False
-        self.update_plots()
+        self._request_plot_update()
 
     def action_pan_right(self):
         """Pan view right (forward in time). Re-engages following if we reach 'now'."""
@@ -665,14 +884,14 @@ class GPUMonitorApp(App):
         self.view_start += shift
         self.view_end += shift
 
-        last_ts = self.all_data[-1]['_ts']
+        last_ts = self.all_data.last_ts
         if self.view_end >= last_ts:
             # We've reached "now" - re-engage following mode
             self.view_end = last_ts
             self.view_start = self.view_end - window_size
             self.following = True
 
-        self.update_plots()
+        self._request_plot_update()
 
     def action_zoom_in(self):
         """Zoom in (show less time). Keeps view anchored to 'now' if following."""
@@ -687,7 +906,7 @@ class GPUMonitorApp(App):
 
         if self.following and self.all_data:
             # Keep anchored to the latest data point
-            last_ts = self.all_data[-1]['_ts']
+            last_ts = self.all_data.last_ts
             self.view_end = last_ts
             self.view_start = self.view_end - new_window
         else:
@@ -696,7 +915,7 @@ class GPUMonitorApp(App):
             self.view_start = center - new_window / 2
             self.view_end = center + new_window / 2
 
-        self.update_plots()
+        self._request_plot_update()
 
     def action_zoom_out(self):
         """Zoom out (show more time). Keeps view anchored to 'now' if following."""
@@ -708,7 +927,7 @@ class GPUMonitorApp(App):
 
         if self.following and self.all_data:
             # Keep anchored to the latest data point
-            last_ts = self.all_data[-1]['_ts']
+            last_ts = self.all_data.last_ts
             self.view_end = last_ts
             self.view_start = self.view_end - new_window
         else:
@@ -719,8 +938,8 @@ class GPUMonitorApp(App):
 
         # Clamp to data bounds
         if self.all_data:
-            first_ts = self.all_data[0]['_ts']
-            last_ts = self.all_data[-1]['_ts']
+            first_ts = self.all_data.first_ts
+            last_ts = self.all_data.last_ts
 
             if self.view_start < first_ts:
                 self.view_start = first_ts
@@ -728,14 +947,14 @@ class GPUMonitorApp(App):
             if self.view_end > last_ts:
                 self.view_end = last_ts
 
-        self.update_plots()
+        self._request_plot_update()
 
     def action_jump_start(self):
         """Jump to start of data. Disengages following mode."""
         if not self.all_data:
             return
 
-        first_ts = self.all_data[0]['_ts']
+        first_ts = self.all_data.first_ts
 
         window_size = self.view_end - self.view_start
         self.view_start = first_ts
@@ -743,7 +962,7 @@ class GPUMonitorApp(App):
 
         # Disengage following - user wants to look at history
         self.following = False
-        self.update_plots()
+        self._request_plot_update()
 
     def action_jump_end(self):
         """Jump to end of data. Re-engages following mode."""
@@ -754,7 +973,7 @@ class GPUMonitorApp(App):
         if not self.all_data:
             return
 
-        last_ts = self.all_data[-1]['_ts']
+        last_ts = self.all_data.last_ts
 
         window_size = self.view_end - self.view_start
         self.view_end = last_ts
@@ -762,20 +981,20 @@ class GPUMonitorApp(App):
 
         # Re-engage following - user wants to see "now"
         self.following = True
-        self.update_plots()
+        self._request_plot_update()
 
     def action_reset_view(self):
         """Reset to default 60s view. Re-engages following mode."""
         self.reset_view()
         # Re-engage following - reset means back to live view
         self.following = True
-        self.update_plots()
+        self._request_plot_update()
 
     def action_toggle_pause(self):
         """Toggle pause state for live updates."""
         if self.live_mode:
             self.paused = not self.paused
-            self.update_plots()
+            self._request_plot_update()
 
     def action_scroll_down(self):
         """Scroll down (vim j)."""
@@ -0,0 +1,111 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from gpu_monitor.history import SampleHistory
+from gpu_monitor.utils import (parse_log_columns, parse_log_file, parse_log_file_incremental,
+                               read_log_snapshot)
+
+T0 = datetime(2026, 1, 1, 12, 0, 0)
+
+
+def _rows(start, count, gpus=(0, 1)):
+    return [{
+        '_ts': T0 + timedelta(seconds=n),
+        'gpu_id': gpus[n % len(gpus)],
+        'utilization_gpu': n % 100,
+        'memory_used': float(n),
+        'memory_total': 81920.0,
+        'temperature': 40.0,
+        'power_draw': n / 4,
+        'process_info': f'p{n}',
+    } for n in range(start, start + count)]
+
+
+def test_extend_and_accessors():
+    history = SampleHistory(_rows(0, 5))
+    history.extend(_rows(5, 5))
+    assert len(history) == 10 == history.appended
+    assert history.column('memory_used').tolist() == list(range(10))
+    assert history.first_ts == T0
+    assert history.last_ts == T0 + timedelta(seconds=9)
+    assert history.row(3) == _rows(3, 1)[0]
+    assert history.gpu_ids == [0, 1]
+    assert history.gpu_rows(1).tolist() == [1, 3, 5, 7, 9]
+    taken = history.take(history.gpu_rows(0, 2, 7), ('process_info',))
+    assert list(taken) == ['process_info']
+    assert taken['process_info'].tolist() == ['p2', 'p4', 'p6']
+
+
+def test_window_is_inclusive():
+    history = SampleHistory(_rows(0, 10))
+    lo, hi = history.window(T0 + timedelta(seconds=2), T0 + timedelta(seconds=5))
+    assert (lo, hi) == (2, 6)
+    assert history.window(T0 - timedelta(seconds=9), T0 - timedelta(seconds=1)) == (0, 0)
+
+
+def test_capacity_keeps_newest_across_compaction():
+    history = SampleHistory(capacity=7)
+    rows = []
+    # Batches of uneven size push storage through several _make_room calls
+    for size in (3, 5, 1, 9, 4, 6, 2, 20, 3):
+        batch = _rows(len(rows), size, gpus=(0, 1, 2))
+        history.extend(batch)
+        rows += batch
+        kept = rows[-7:]
+        assert len(history) == len(kept)
+        assert history.appended == len(rows)
+        assert history.column('memory_used').tolist() == [r['memory_used'] for r in kept]
+        assert history.first_ts == kept[0]['_ts']
+        assert history.last_ts == kept[-1]['_ts']
+        for gpu_id in (0, 1, 2):
+            expected = [i for i, r in enumerate(kept) if r['gpu_id'] == gpu_id]
+            assert history.gpu_rows(gpu_id).tolist() == expected
+        lo, hi = history.window(kept[2]['_ts'], kept[-1]['_ts'])
+        assert (lo, hi) == (2, len(kept))
+    assert len(history._columns['_ts']) <= 14
+
+
+def test_columnar_load_matches_row_parser(tmp_path):
+    path = tmp_path / 'gpu.csv'
+    path.write_text(
+        'timestamp,gpu_id,utilization_gpu,memory_used,memory_total,temperature,power_draw,process_info\n'
+        '2026/01/01 12:00:00.000,0,10,500,81920,40,100.5,"python a,b.py"\n'
+        '2026/01/01 12:00:00.000,1,20,600,81920,41,,\n'
+        '2026/01/01 12:00:01.000,0,30,700,81920,42,150.25,#x\n'
+    )
+    by_rows = SampleHistory(parse_log_file(path))
+    by_columns = SampleHistory()
+    by_columns.extend_columns(parse_log_columns(path))
+    for name in ('_ts', 'gpu_id', 'utilization_gpu', 'memory_used', 'memory_total',
+                 'temperature', 'power_draw', 'process_info'):
+        assert np.array_equal(by_rows.column(name), by_columns.column(name)), name
+    assert by_columns.column('process_info').tolist() == ['python a,b.py', '', '#x']
+
+
+def test_snapshot_ignores_rows_appended_mid_load(tmp_path, monkeypatch):
+    path = tmp_path / 'gpu.csv'
+    header = 'timestamp,gpu_id,utilization_gpu,memory_used,memory_total,temperature,power_draw\n'
+    rows = ''.join(f'2026/01/01 12:00:{n:02d}.000,0,{n},500,81920,40,100\n' for n in range(10))
+    path.write_text(header + rows + '2026/01/01 12:00:10.000,0,1')  # row still being written
+    size = len(header + rows)
+
+    # The logger appends a row between the numeric and the text pass
+    real_loadtxt = np.loadtxt
+    def loadtxt(*args, **kwargs):
+        if 'dtype' in kwargs:
+            with open(path, 'a') as f:
+                f.write('0,500,81920,40,100\n2026/01/01 12:00:11.000,0,1,500,81920,40,100\n')
+        return real_loadtxt(*args, **kwargs)
+    monkeypatch.setattr(np, 'loadtxt', loadtxt)
+
+    snapshot, file_pos = read_log_snapshot(path)
+    columns = parse_log_columns(snapshot)
+    assert file_pos == size
+    assert all(len(values) == 10 for values in columns.values())
+    history = SampleHistory()
+    history.extend_columns(columns)
+    assert history.column('utilization_gpu').tolist() == list(range(10))
+
+    new_rows, _ = parse_log_file_incremental(path, file_pos)
+    assert [row['_ts'].second for row in new_rows] == [10, 11]
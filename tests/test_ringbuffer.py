@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+
+from gpu_monitor.ringbuffer import RingBuffer
+
+
+def test_view_is_oldest_first_after_wrap():
+    ring = RingBuffer(4)
+    for value in range(7):
+        ring.append(value)
+    assert len(ring) == 4
+    assert ring.view().tolist() == [3, 4, 5, 6]
+
+
+def test_extend_wraps_and_keeps_newest():
+    ring = RingBuffer(5, dtype=np.uint8)
+    ring.extend([1, 2, 3])
+    ring.extend([4, 5, 6, 7])
+    assert ring.view().tolist() == [3, 4, 5, 6, 7]
+    ring.extend(range(20))
+    assert ring.view().tolist() == [15, 16, 17, 18, 19]
+    assert ring.view().dtype == np.uint8
+
+
+def test_view_is_read_only_and_clear_empties():
+    ring = RingBuffer(3)
+    ring.extend([1.0, 2.0])
+    with pytest.raises(ValueError):
+        ring.view()[0] = 5
+    ring.clear()
+    assert len(ring) == 0
+    assert ring.view().tolist() == []
+
+
+def test_capacity_must_be_positive():
+    with pytest.raises(ValueError):
+        RingBuffer(0)
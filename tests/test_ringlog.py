@@ -0,0 +1,79 @@
+from datetime import datetime
+
+from gpu_monitor.ringlog import RingLogWriter, get_ring_head, read_ring_log
+
+
+def _row(second, gpu_id, util='50', power='100.25', proc=''):
+    ts = f'2026/01/01 12:00:{second:02d}.000'
+    return (ts, str(gpu_id), util, '1024', '81920', '40', power, proc)
+
+
+def test_round_trip(tmp_path):
+    path = tmp_path / 'gpu.ring'
+    writer = RingLogWriter(path, slots=8)
+    writer.append([_row(0, 0, proc='python train.py'), _row(0, 1)])
+    writer.close()
+
+    rows, head = read_ring_log(path)
+    assert head == 2 == get_ring_head(path)
+    assert [row['gpu_id'] for row in rows] == [0, 1]
+    first = rows[0]
+    assert first['_ts'] == datetime(2026, 1, 1, 12, 0, 0)
+    assert first['timestamp'] == '2026/01/01 12:00:00.000'
+    assert first['utilization_gpu'] == 50.0
+    assert first['memory_used'] == 1024.0
+    assert first['memory_total'] == 81920.0
+    assert first['power_draw'] == 100.25
+    assert first['process_info'] == 'python train.py'
+    assert rows[1]['process_info'] == ''
+
+
+def test_wraparound_keeps_newest_and_reads_since(tmp_path):
+    path = tmp_path / 'gpu.ring'
+    writer = RingLogWriter(path, slots=4)
+    for second in range(6):
+        writer.append([_row(second, 0)])
+    writer.close()
+
+    rows, head = read_ring_log(path)
+    assert head == 6
+    assert [row['_ts'].second for row in rows] == [2, 3, 4, 5]
+
+    # Rows already overwritten are skipped; newer ones are returned
+    rows, _ = read_ring_log(path, since=1)
+    assert [row['_ts'].second for row in rows] == [2, 3, 4, 5]
+    rows, _ = read_ring_log(path, since=4)
+    assert [row['_ts'].second for row in rows] == [4, 5]
+    assert read_ring_log(path, since=6) == ([], 6)
+
+
+def test_procs_sidecar_keeps_indices_across_writers(tmp_path):
+    path = tmp_path / 'gpu.ring'
+    writer = RingLogWriter(path, slots=8)
+    writer.append([_row(0, 0, proc='a'), _row(0, 1, proc='b')])
+    writer.close()
+
+    writer = RingLogWriter(path, slots=8)
+    writer.append([_row(1, 0, proc='b'), _row(1, 1, proc='c')])
+    writer.close()
+
+    assert (tmp_path / 'gpu.ring.procs').read_text() == '\na\nb\nc\n'
+    rows, head = read_ring_log(path)
+    assert head == 4
+    assert [row['process_info'] for row in rows] == ['a', 'b', 'b', 'c']
+
+
+def test_unavailable_and_out_of_range_readings(tmp_path):
+    path = tmp_path / 'gpu.ring'
+    writer = RingLogWriter(path, slots=8)
+    writer.append([
+        _row(0, 0, util='[N/A]', power='[Not Supported]'),
+        _row(0, 1, util='300', power=''),
+    ])
+    writer.close()
+
+    rows, _ = read_ring_log(path)
+    assert rows[0]['utilization_gpu'] == 0.0
+    assert rows[0]['power_draw'] == 0.0
+    assert rows[1]['utilization_gpu'] == 255.0
+    assert rows[1]['power_draw'] == 0.0